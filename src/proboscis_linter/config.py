@@ -1,6 +1,7 @@
 """Configuration management for proboscis-linter."""
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import tomllib
 from pydantic import BaseModel, Field, field_validator
 from loguru import logger
@@ -82,50 +83,96 @@ class ProboscisConfig(BaseModel):
         return self.rules[rule_id].options
 
 
+@lru_cache(maxsize=1024)
+def _has_proboscis_section(config_file: Path, mtime_ns: int, size: int) -> bool:
+    """Check whether a TOML file has a [tool.proboscis] section.
+    
+    Keyed on the file's mtime and size as well as its path, so edits are seen.
+    Files that never mention "proboscis" are rejected without a TOML parse.
+    """
+    try:
+        raw = config_file.read_bytes()
+        # Any spelling of the section (table header, dotted key) names it literally
+        if b"proboscis" not in raw:
+            return False
+        data = tomllib.loads(raw.decode())
+    except Exception:
+        return False
+    return "tool" in data and "proboscis" in data["tool"]
+
+
+@lru_cache(maxsize=256)
+def _load_config(
+    config_path: Path, mtime_ns: int, size: int
+) -> Tuple[Optional[ProboscisConfig], Tuple[Tuple[str, Any], ...]]:
+    """Parse and validate one version of a pyproject.toml file.
+    
+    Keyed on mtime and size like _has_proboscis_section, so edits are seen.
+    Returns the config (None without a [tool.proboscis] section) and the
+    rule entries that were skipped as invalid. Parse and validation errors
+    propagate and are not cached. Logging is left to the caller so it
+    happens on every load, not only on a cache miss.
+    """
+    with open(config_path, "rb") as f:
+        data = tomllib.load(f)
+    
+    # Extract proboscis configuration
+    proboscis_data = data.get("tool", {}).get("proboscis", {})
+    
+    if not proboscis_data:
+        return None, ()
+    
+    # Convert rule configuration
+    rules_data = proboscis_data.get("rules", {})
+    rules_config = {}
+    invalid_rules = []
+    
+    for rule_id, rule_value in rules_data.items():
+        if isinstance(rule_value, bool):
+            rules_config[rule_id] = RuleConfig(enabled=rule_value)
+        elif isinstance(rule_value, dict):
+            rules_config[rule_id] = RuleConfig(**rule_value)
+        else:
+            invalid_rules.append((rule_id, rule_value))
+    
+    proboscis_data["rules"] = rules_config
+    
+    return ProboscisConfig(**proboscis_data), tuple(invalid_rules)
+
+
 class ConfigLoader:
     """Loads configuration from pyproject.toml."""
     
     @staticmethod
     def load_from_file(config_path: Path) -> ProboscisConfig:
-        """Load configuration from a pyproject.toml file."""
+        """Load configuration from a pyproject.toml file.
+        
+        Parsing is cached per file version; each call returns its own copy.
+        """
         with logger.contextualize(config_file=str(config_path)):
-            if not config_path.exists():
+            try:
+                stat = config_path.stat()
+            except OSError:
                 logger.debug("No pyproject.toml found, using defaults")
                 return ProboscisConfig()
             
             try:
-                with open(config_path, "rb") as f:
-                    data = tomllib.load(f)
-                
-                # Extract proboscis configuration
-                proboscis_data = data.get("tool", {}).get("proboscis", {})
-                
-                if not proboscis_data:
-                    logger.debug("No [tool.proboscis] section found, using defaults")
-                    return ProboscisConfig()
-                
-                # Convert rule configuration
-                rules_data = proboscis_data.get("rules", {})
-                rules_config = {}
-                
-                for rule_id, rule_value in rules_data.items():
-                    if isinstance(rule_value, bool):
-                        rules_config[rule_id] = RuleConfig(enabled=rule_value)
-                    elif isinstance(rule_value, dict):
-                        rules_config[rule_id] = RuleConfig(**rule_value)
-                    else:
-                        logger.warning(f"Invalid rule configuration for {rule_id}: {rule_value}")
-                
-                proboscis_data["rules"] = rules_config
-                
-                config = ProboscisConfig(**proboscis_data)
-                logger.info("Loaded configuration from pyproject.toml")
-                return config
-                
+                config, invalid_rules = _load_config(config_path, stat.st_mtime_ns, stat.st_size)
             except Exception as e:
                 logger.error(f"Failed to load configuration: {e}")
                 logger.info("Using default configuration")
                 return ProboscisConfig()
+            
+            if config is None:
+                logger.debug("No [tool.proboscis] section found, using defaults")
+                return ProboscisConfig()
+            
+            for rule_id, rule_value in invalid_rules:
+                logger.warning(f"Invalid rule configuration for {rule_id}: {rule_value}")
+            
+            logger.info("Loaded configuration from pyproject.toml")
+            # The cached instance is shared; hand out a copy callers may mutate
+            return config.model_copy(deep=True)
     
     @staticmethod
     def find_config_file(start_path: Path) -> Optional[Path]:
@@ -134,16 +181,14 @@ class ConfigLoader:
         
         while current != current.parent:
             config_file = current / "pyproject.toml"
-            if config_file.exists():
-                # Check if it has [tool.proboscis] section
-                try:
-                    with open(config_file, "rb") as f:
-                        data = tomllib.load(f)
-                    if "tool" in data and "proboscis" in data["tool"]:
-                        logger.debug(f"Found configuration at {config_file}")
-                        return config_file
-                except Exception:
-                    pass
+            try:
+                stat = config_file.stat()
+            except OSError:
+                stat = None
+            # Check if it has [tool.proboscis] section
+            if stat is not None and _has_proboscis_section(config_file, stat.st_mtime_ns, stat.st_size):
+                logger.debug(f"Found configuration at {config_file}")
+                return config_file
             
             current = current.parent
         
@@ -0,0 +1,268 @@
+"""Shared pytest configuration for the proboscis-linter test suite."""
+import hashlib
+import importlib.util
+import os
+import re
+import shutil
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+
+from proboscis_linter.config import ProboscisConfig
+from proboscis_linter.report_generator import JsonReportGenerator, TextReportGenerator
+from proboscis_linter.rust_linter import RustLinterWrapper
+
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Sources whose content decides the outcome of tests marked cache_unchanged
+_LINTER_SOURCE_DIRS = [
+    (_PROJECT_ROOT / "src" / "proboscis_linter", "*.py"),
+    (_PROJECT_ROOT / "rust" / "src", "*.rs"),
+]
+
+# The built extension is what the tests actually exercise, not rust/src
+_RUST_EXTENSION = "proboscis_linter.proboscis_linter_rust"
+
+_PASSED_DIGESTS_KEY = "proboscis/unchanged_passed"
+_DIGEST_KEY = pytest.StashKey[str]()
+_DIGEST_PROPERTY = "cache_unchanged_digest"
+
+# Outcomes of cache_unchanged tests seen by this process, written back once at session end
+_UNCHANGED_RESULTS: Dict[str, Optional[str]] = {}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--skip-unchanged",
+        action="store_true",
+        default=False,
+        help="Skip cache_unchanged tests whose inputs are unchanged since they last passed."
+    )
+
+
+@lru_cache(maxsize=1)
+def _shared_inputs_digest() -> bytes:
+    """Hash the linter sources, the built Rust extension and this conftest."""
+    digest = hashlib.sha256()
+    for source_dir, pattern in _LINTER_SOURCE_DIRS:
+        for path in sorted(source_dir.rglob(pattern)):
+            digest.update(str(path.relative_to(_PROJECT_ROOT)).encode())
+            digest.update(path.read_bytes())
+    spec = importlib.util.find_spec(_RUST_EXTENSION)
+    if spec is None or spec.origin is None:
+        digest.update(b"<no rust extension>")
+    else:
+        digest.update(Path(spec.origin).read_bytes())
+    digest.update(Path(__file__).read_bytes())
+    return digest.digest()
+
+
+def _inputs_digest(test_file: Path) -> str:
+    """Hash the shared linter inputs together with the test module itself."""
+    digest = hashlib.sha256(_shared_inputs_digest())
+    digest.update(test_file.read_bytes())
+    return digest.hexdigest()
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip cache_unchanged tests that passed last time with identical inputs."""
+    if getattr(config, "cache", None) is None:
+        return
+    skip_enabled = config.getoption("skip_unchanged")
+    passed = config.cache.get(_PASSED_DIGESTS_KEY, {})
+    digests = {}
+    for item in items:
+        if item.get_closest_marker("cache_unchanged") is None:
+            continue
+        if item.path not in digests:
+            digests[item.path] = _inputs_digest(item.path)
+        item.stash[_DIGEST_KEY] = digests[item.path]
+        if skip_enabled and passed.get(item.nodeid) == digests[item.path]:
+            item.add_marker(pytest.mark.skip(reason="cached: inputs unchanged since last pass"))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Attach the input digest to the call report of cache_unchanged tests."""
+    outcome = yield
+    report = outcome.get_result()
+    digest = item.stash.get(_DIGEST_KEY, None)
+    if digest is not None and report.when == "call":
+        # user_properties travel with the report from xdist workers to the controller
+        report.user_properties.append((_DIGEST_PROPERTY, digest))
+
+
+def pytest_runtest_logreport(report):
+    """Collect cache_unchanged outcomes; on xdist this runs on the controller too."""
+    digest = dict(report.user_properties).get(_DIGEST_PROPERTY)
+    if digest is not None:
+        _UNCHANGED_RESULTS[report.nodeid] = digest if report.passed else None
+
+
+def pytest_sessionfinish(session):
+    """Write the collected cache_unchanged outcomes once, from the controller only."""
+    config = session.config
+    if hasattr(config, "workerinput") or not _UNCHANGED_RESULTS or getattr(config, "cache", None) is None:
+        return
+    passed = config.cache.get(_PASSED_DIGESTS_KEY, {})
+    for nodeid, digest in _UNCHANGED_RESULTS.items():
+        if digest is None:
+            passed.pop(nodeid, None)
+        else:
+            passed[nodeid] = digest
+    config.cache.set(_PASSED_DIGESTS_KEY, passed)
+
+
+# A -m expression that selects perf tests rather than excluding them
+_PERF_SELECTED_RE = re.compile(r"(?<!not )\bperf\b")
+
+# pytest-benchmark options that do not ask for timings
+_NON_TIMING_BENCHMARK_OPTIONS = ("--benchmark-skip", "--benchmark-disable")
+
+
+def _wants_benchmarks(config) -> bool:
+    """Whether this run selects perf tests or passes pytest-benchmark options."""
+    if _PERF_SELECTED_RE.search(config.getoption("markexpr", "") or ""):
+        return True
+    return any(
+        arg.startswith("--benchmark") and not arg.startswith(_NON_TIMING_BENCHMARK_OPTIONS)
+        for arg in config.invocation_params.args
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """Run tests across all CPUs by default when pytest-xdist is installed.
+    
+    Benchmark runs stay in one process: pytest-benchmark disables itself under xdist.
+    """
+    if not config.pluginmanager.hasplugin("xdist") or hasattr(config, "workerinput"):
+        return
+    if _wants_benchmarks(config):
+        return
+    if config.getoption("numprocesses", None) is None and not config.getoption("collectonly"):
+        config.option.numprocesses = "auto"
+        # Keep xdist_group-marked tests (e.g. shared module fixtures) on one worker
+        if config.getoption("dist", "no") == "no":
+            config.option.dist = "loadgroup"
+
+
+def _write_tree(root: Path, files: Dict[str, bytes]) -> None:
+    """Write each relative path in files under root, creating parent directories."""
+    paths = {rel_path: root / rel_path for rel_path in files}
+    # One makedirs per leaf directory; it creates the ancestors on the way
+    parents = {path.parent for path in paths.values()}
+    for parent in parents.difference(*(parent.parents for parent in parents)):
+        os.makedirs(parent, exist_ok=True)
+    for rel_path, data in files.items():
+        fd = os.open(paths[rel_path], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+
+@pytest.fixture(scope="session")
+def write_tree():
+    """Helper that writes a {relative_path: bytes} mapping under a root directory."""
+    return _write_tree
+
+
+# Output of the template git commands is never read
+_QUIET = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+
+_GIT_USER_CONFIG = b"[user]\n\temail = test@example.com\n\tname = Test User\n"
+
+
+def _init_git_repo(path: Path, template: Path) -> None:
+    """Initialize a git repository in the given path from a git init template."""
+    subprocess.run(["git", "init", "-q", f"--template={template}"], cwd=path, check=True, **_QUIET)
+
+
+@pytest.fixture(scope="session")
+def git_init_template(tmp_path_factory):
+    """git init template directory whose config already carries the commit identity."""
+    template = tmp_path_factory.mktemp("git_init_template")
+    (template / "config").write_bytes(_GIT_USER_CONFIG)
+    return template
+
+
+@pytest.fixture(scope="session")
+def git_repo_template(git_init_template, tmp_path_factory):
+    """Git repository with one committed placeholder file, built once per session."""
+    root = tmp_path_factory.mktemp("git_repo_template")
+    _init_git_repo(root, git_init_template)
+    (root / "README.md").write_bytes(b"# Placeholder\n")
+    subprocess.run(["git", "add", "."], cwd=root, check=True, **_QUIET)
+    subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=root, check=True, **_QUIET)
+    return root
+
+
+@pytest.fixture
+def fresh_repo(git_repo_template, tmp_path):
+    """Private copy of the template repository for a single test."""
+    repo = tmp_path / "repo"
+    shutil.copytree(git_repo_template, repo)
+    return repo
+
+
+@pytest.fixture(scope="session")
+def default_config() -> ProboscisConfig:
+    """Default configuration shared by all tests; do not mutate it."""
+    return ProboscisConfig()
+
+
+@pytest.fixture(scope="session")
+def text_gen():
+    """Stateless text report generator shared by all tests."""
+    return TextReportGenerator()
+
+
+@pytest.fixture(scope="session")
+def json_gen():
+    """Stateless JSON report generator shared by all tests."""
+    return JsonReportGenerator()
+
+
+@pytest.fixture
+def captured_print(monkeypatch):
+    """Replace print() for one test and return the list of printed lines."""
+    lines: List[str] = []
+    monkeypatch.setattr('builtins.print', lambda *args, **kwargs: lines.append(" ".join(map(str, args))))
+    return lines
+
+
+@pytest.fixture(scope="session")
+def rust_wrapper_spec():
+    """RustLinterWrapper attribute names, introspected once for Mock(spec=...)."""
+    return dir(RustLinterWrapper)
+
+
+class _FakeClock:
+    """Stand-in for the time module whose sleep() advances time() instantly."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+    def timed_lint(self, seconds: float, violations: list):
+        """lint_project stand-in that takes `seconds` on this clock and returns `violations`."""
+        def lint_project(path):
+            self.sleep(seconds)
+            return violations
+        return lint_project
+
+
+@pytest.fixture
+def fake_clock():
+    """Fresh fake clock; monkeypatch it over a module's `time` to skip real sleeps."""
+    return _FakeClock()
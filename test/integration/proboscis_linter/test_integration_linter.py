@@ -1,13 +1,35 @@
 """Integration tests for linter module."""
+import os
 import tempfile
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
 from pathlib import Path
+from unittest.mock import patch, Mock
 import pytest
 from proboscis_linter.linter import ProboscisLinter
 from proboscis_linter.config import ProboscisConfig, RuleConfig
 from proboscis_linter.models import LintViolation
 
 
+# Default configuration shared by tests that never mutate it
+_DEFAULT_CONFIG = ProboscisConfig()
+
+# Commit identity passed on the command line instead of via `git config`
+_GIT_IDENTITY = ["-c", "user.email=test@example.com", "-c", "user.name=Test User"]
+
+
+def _isolated_git_env(home: Path) -> dict:
+    """Environment that keeps git from reading global and system config files."""
+    return {
+        "GIT_CONFIG_GLOBAL": os.devnull,
+        "GIT_CONFIG_SYSTEM": os.devnull,
+        "HOME": str(home),
+        "PATH": os.environ["PATH"],
+    }
+
+
 @pytest.mark.integration
 def test_ProboscisLinter_lint_project():
     """Integration test for ProboscisLinter.lint_project method."""
@@ -19,7 +41,7 @@ def test_ProboscisLinter_lint_project():
         src.mkdir()
         
         # Create a Python file with functions
-        (src / "example.py").write_text("""
+        (src / "example.py").write_bytes(b"""
 def add(a, b):
     return a + b
 
@@ -41,8 +63,9 @@ def subtract(x, y):
         
         # Should find violations for missing tests
         assert len(violations) > 0
-        assert any(v.function_name == "add" for v in violations)
-        assert any(v.function_name == "subtract" for v in violations)
+        function_names = {v.function_name for v in violations}
+        assert "add" in function_names
+        assert "subtract" in function_names
 
 
 @pytest.mark.integration
@@ -53,7 +76,7 @@ def test_ProboscisLinter_lint_file():
         
         # Create a Python file
         file_path = root / "module.py"
-        file_path.write_text("""
+        file_path.write_bytes(b"""
 def process_data(data):
     return data * 2
 
@@ -66,14 +89,15 @@ def validate_input(value):
         test_dir.mkdir()
         
         # Run linter on single file
-        config = ProboscisConfig()
+        config = _DEFAULT_CONFIG
         linter = ProboscisLinter(config)
         violations = linter.lint_file(file_path, [test_dir])
         
         # Should find violations
         assert len(violations) > 0
-        assert any(v.function_name == "process_data" for v in violations)
-        assert any(v.function_name == "validate_input" for v in violations)
+        function_names = {v.function_name for v in violations}
+        assert "process_data" in function_names
+        assert "validate_input" in function_names
 
 
 @pytest.mark.integration
@@ -82,20 +106,22 @@ def test_ProboscisLinter_lint_changed_files():
     with tempfile.TemporaryDirectory() as tmpdir:
         root = Path(tmpdir)
         
-        # Initialize git repo
-        subprocess.run(["git", "init"], cwd=root, capture_output=True)
-        subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=root, capture_output=True)
-        subprocess.run(["git", "config", "user.name", "Test User"], cwd=root, capture_output=True)
+        # Initialize git repo without loading the user's or system gitconfig
+        env = _isolated_git_env(root)
+        subprocess.run(["git", "init"], cwd=root, env=env, capture_output=True)
         
         # Create initial file and commit
         initial_file = root / "initial.py"
-        initial_file.write_text("# Initial file")
-        subprocess.run(["git", "add", "."], cwd=root, capture_output=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=root, capture_output=True)
+        initial_file.write_bytes(b"# Initial file")
+        subprocess.run(["git", "add", "."], cwd=root, env=env, capture_output=True)
+        subprocess.run(
+            ["git", *_GIT_IDENTITY, "commit", "-m", "Initial commit"],
+            cwd=root, env=env, capture_output=True
+        )
         
         # Create changed file
         changed_file = root / "changed.py"
-        changed_file.write_text("""
+        changed_file.write_bytes(b"""
 def new_function():
     return "new"
 
@@ -107,13 +133,13 @@ def another_new_function():
         (root / "test").mkdir()
         
         # Run linter on changed files
-        config = ProboscisConfig()
+        config = _DEFAULT_CONFIG
         linter = ProboscisLinter(config)
         violations = linter.lint_changed_files(root)
         
         # Should find violations only for the new file
         assert len(violations) > 0
-        assert all(str(v.file_path).endswith("changed.py") for v in violations)
+        assert {v.file_path.name for v in violations} <= {"changed.py"}
 
 
 class TestLinterIntegration:
@@ -130,7 +156,7 @@ class TestLinterIntegration:
             src.mkdir()
             
             # Main module
-            (src / "main.py").write_text("""
+            (src / "main.py").write_bytes(b"""
 def initialize_app():
     pass
 
@@ -151,8 +177,8 @@ class Application:
             # Utils module
             utils = src / "utils"
             utils.mkdir()
-            (utils / "__init__.py").write_text("")
-            (utils / "helpers.py").write_text("""
+            (utils / "__init__.py").write_bytes(b"")
+            (utils / "helpers.py").write_bytes(b"""
 def validate_input(data):
     return True
 
@@ -166,8 +192,8 @@ def log_message(msg):  # noqa: PL001
             # Database module
             db = src / "database"
             db.mkdir()
-            (db / "__init__.py").write_text("")
-            (db / "models.py").write_text("""
+            (db / "__init__.py").write_bytes(b"")
+            (db / "models.py").write_bytes(b"""
 class User:
     def save(self):
         pass
@@ -194,7 +220,7 @@ class Session:
             # Unit tests
             unit = tests / "unit"
             unit.mkdir()
-            (unit / "test_main.py").write_text("""
+            (unit / "test_main.py").write_bytes(b"""
 @pytest.mark.integration
 def test_initialize_app():
     pass
@@ -204,7 +230,7 @@ def test_Application_start():
     pass
 """)
             
-            (unit / "test_helpers.py").write_text("""
+            (unit / "test_helpers.py").write_bytes(b"""
 @pytest.mark.integration
 def test_validate_input():
     pass
@@ -213,7 +239,7 @@ def test_validate_input():
             # Integration tests
             integration = tests / "integration"
             integration.mkdir()
-            (integration / "test_database.py").write_text("""
+            (integration / "test_database.py").write_bytes(b"""
 @pytest.mark.integration
 def test_User_save():
     pass
@@ -226,7 +252,7 @@ def test_Session_create():
             # E2E tests
             e2e = tests / "e2e"
             e2e.mkdir()
-            (e2e / "test_application.py").write_text("""
+            (e2e / "test_application.py").write_bytes(b"""
 @pytest.mark.integration
 def test_Application_restart():
     pass
@@ -237,7 +263,7 @@ def test_Application_restart():
     @pytest.mark.integration
     def test_lint_complex_project(self, complex_project):
         """Test linting a complex project with various scenarios."""
-        linter = ProboscisLinter()
+        linter = ProboscisLinter(_DEFAULT_CONFIG)
         violations = linter.lint_project(complex_project)
         
         # Analyze violations
@@ -287,7 +313,8 @@ def test_Application_restart():
         violations = linter.lint_project(complex_project)
         
         # Should not have any violations from database module
-        assert all("database" not in str(v.file_path) for v in violations)
+        path_parts = [set(v.file_path.parts) for v in violations]
+        assert all("database" not in parts for parts in path_parts)
         
         # Should not have any PL002 violations
         assert all("PL002" not in v.rule_name for v in violations)
@@ -301,8 +328,6 @@ def test_Application_restart():
     @pytest.mark.integration
     def test_lint_changed_files_integration(self, complex_project):
         """Test linting changed files with mocked git changes."""
-        from unittest.mock import patch, Mock
-        
         # Mock the rust linter to simulate changed files
         with patch('proboscis_linter.linter.RustLinterWrapper') as mock_wrapper_class:
             mock_wrapper = Mock()
@@ -329,7 +354,7 @@ def test_Application_restart():
             ]
             mock_wrapper.lint_changed_files.return_value = mock_violations
             
-            linter = ProboscisLinter()
+            linter = ProboscisLinter(_DEFAULT_CONFIG)
             violations = linter.lint_changed_files(complex_project)
             
             assert len(violations) == 2
@@ -339,7 +364,7 @@ def test_Application_restart():
     @pytest.mark.integration
     def test_incremental_test_development(self, complex_project):
         """Test how violations change as tests are added incrementally."""
-        linter = ProboscisLinter()
+        linter = ProboscisLinter(_DEFAULT_CONFIG)
         
         # Initial state - get baseline violations
         initial_violations = linter.lint_project(complex_project)
@@ -347,7 +372,8 @@ def test_Application_restart():
         
         # Add more unit tests
         unit_test_file = complex_project / "test" / "unit" / "test_main.py"
-        unit_test_file.write_text(unit_test_file.read_text() + """
+        with open(unit_test_file, "ab") as f:
+            f.write(b"""
 @pytest.mark.integration
 def test_run_server():
     pass
@@ -371,7 +397,7 @@ def test_Application_stop():
         
         # Add integration tests
         integration_test_file = complex_project / "test" / "integration" / "test_main_integration.py"
-        integration_test_file.write_text("""
+        integration_test_file.write_bytes(b"""
 @pytest.mark.integration
 def test_run_server_integration():
     pass
@@ -397,7 +423,7 @@ def test_Application_stop_integration():
             # Create source files
             src = root / "src"
             src.mkdir()
-            (src / "module.py").write_text("""
+            (src / "module.py").write_bytes(b"""
 def func1():
     pass
 
@@ -412,7 +438,7 @@ def func3():
             # Standard location
             standard_tests = root / "test" / "unit"
             standard_tests.mkdir(parents=True)
-            (standard_tests / "test_module.py").write_text("""
+            (standard_tests / "test_module.py").write_bytes(b"""
 @pytest.mark.integration
 def test_func1():
     pass
@@ -421,7 +447,7 @@ def test_func1():
             # Alternative location
             alt_tests = root / "tests"
             alt_tests.mkdir()
-            (alt_tests / "test_module.py").write_text("""
+            (alt_tests / "test_module.py").write_bytes(b"""
 @pytest.mark.integration
 def test_func2():
     pass
@@ -430,14 +456,14 @@ def test_func2():
             # Custom location (not in default config)
             custom_tests = root / "spec"
             custom_tests.mkdir()
-            (custom_tests / "module_spec.py").write_text("""
+            (custom_tests / "module_spec.py").write_bytes(b"""
 @pytest.mark.integration
 def test_func3():
     pass
 """)
             
             # Test with default config
-            linter = ProboscisLinter()
+            linter = ProboscisLinter(_DEFAULT_CONFIG)
             violations = linter.lint_project(root)
             
             # func1 and func2 should have their tests found in standard locations
@@ -459,19 +485,22 @@ def test_func3():
             assert "func3" not in func_violations_custom or len(func_violations_custom) == 0
     
     @pytest.mark.integration
-    def test_performance_with_many_files(self):
+    @pytest.mark.parametrize("num_modules, files_per_module", [
+        (5, 2),
+        pytest.param(20, 5, marks=pytest.mark.perf),
+    ])
+    def test_performance_with_many_files(self, num_modules, files_per_module):
         """Test linter performance with many files."""
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
             
-            # Create many modules
-            for i in range(20):
-                module_dir = root / f"module_{i}"
-                module_dir.mkdir()
-                
-                for j in range(5):
-                    module_file = module_dir / f"file_{j}.py"
-                    module_file.write_text(f"""
+            # Create many modules: directories first, then write files in parallel
+            for i in range(num_modules):
+                (root / f"module_{i}").mkdir()
+            
+            def write_module_file(i, j):
+                module_file = root / f"module_{i}" / f"file_{j}.py"
+                module_file.write_bytes(f"""
 def function_{i}_{j}_a():
     pass
 
@@ -484,7 +513,11 @@ class Class_{i}_{j}:
     
     def method2(self):
         pass
-""")
+""".encode())
+            
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                # Consume the iterator so write errors propagate
+                list(executor.map(lambda ij: write_module_file(*ij), product(range(num_modules), range(files_per_module))))
             
             # Add some tests
             test_dir = root / "test" / "unit"
@@ -492,29 +525,31 @@ class Class_{i}_{j}:
             
             for i in range(5):  # Only test first 5 modules
                 test_file = test_dir / f"test_module_{i}.py"
-                test_file.write_text(f"""
+                test_file.write_bytes(f"""
 def test_function_{i}_0_a():
     pass
 
 def test_Class_{i}_0_method1():
     pass
-""")
+""".encode())
             
             # Time the linting
-            import time
             start_time = time.time()
             
-            linter = ProboscisLinter()
+            linter = ProboscisLinter(_DEFAULT_CONFIG)
             violations = linter.lint_project(root)
             
             end_time = time.time()
             execution_time = end_time - start_time
             
             # Should complete in reasonable time
-            assert execution_time < 30  # 30 seconds for 100 files
+            assert execution_time < 30  # 30 seconds for up to 100 files
+            
+            # Each file defines two functions and two methods
+            num_functions = num_modules * files_per_module * 4
             
             # Should find many violations
-            assert len(violations) > 100
+            assert len(violations) > num_functions
             
             # Verify some functions have tests and others don't
             tested_functions = {"function_0_0_a", "function_1_0_a", "function_2_0_a", 
@@ -523,4 +558,4 @@ def test_Class_{i}_0_method1():
             untested_violations = [v for v in violations 
                                   if v.function_name not in tested_functions 
                                   and "PL001" in v.rule_name]
-            assert len(untested_violations) > 50
\ No newline at end of file
+            assert len(untested_violations) > num_functions // 2
\ No newline at end of file
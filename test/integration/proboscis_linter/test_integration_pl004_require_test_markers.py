@@ -1,6 +1,9 @@
 """Integration tests for PL004 rule that requires pytest markers on test functions."""
+import json
+import operator
 import tempfile
 import subprocess
+import time
 from pathlib import Path
 import pytest
 from click.testing import CliRunner
@@ -9,6 +12,9 @@ from proboscis_linter.linter import ProboscisLinter
 from proboscis_linter.config import ProboscisConfig
 
 
+_RUNNER = CliRunner()
+
+
 @pytest.mark.integration
 def test_pl004_integration_with_full_project():
     """Test PL004 on a full project with mixed test types."""
@@ -92,10 +98,10 @@ def test_missing_marker():  # Missing @pytest.mark.e2e
         assert "test_missing_marker" in violation_funcs
 
 
-@pytest.mark.integration
-def test_pl004_cli_integration():
-    """Test PL004 via CLI with JSON output."""
-    with tempfile.TemporaryDirectory() as tmpdir:
+@pytest.fixture(scope="module")
+def pl004_cli_violations(tmp_path_factory):
+    """Run the CLI once with JSON output and return the parsed PL004 violations."""
+    with _RUNNER.isolated_filesystem(temp_dir=tmp_path_factory.mktemp("pl004_cli")) as tmpdir:
         root = Path(tmpdir)
         
         # Create test file
@@ -114,22 +120,31 @@ def test_with_marker():
 """)
         
         # Run CLI
-        runner = CliRunner()
-        result = runner.invoke(cli, [str(root), "--format", "json"])
-        
-        # Parse JSON output
-        import json
-        output_data = json.loads(result.output)
-        
-        # Check for PL004 violations
-        pl004_violations = [
-            v for v in output_data["violations"]
-            if v["rule"].startswith("PL004")
-        ]
-        
-        assert len(pl004_violations) == 1
-        assert pl004_violations[0]["function"] == "test_missing_marker"
-        assert "@pytest.mark.unit" in pl004_violations[0]["message"]
+        result = _RUNNER.invoke(cli, [str(root), "--format", "json"])
+    
+    # Parse JSON output once for all assertions
+    output_data = json.loads(result.output)
+    return [
+        v for v in output_data["violations"]
+        if v["rule"].startswith("PL004")
+    ]
+
+
+@pytest.mark.integration
+def test_pl004_cli_integration(pl004_cli_violations):
+    """Test PL004 via CLI with JSON output."""
+    assert len(pl004_cli_violations) == 1
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("field, expected, matches", [
+    # The function name must match exactly; the message only has to mention the marker
+    ("function", "test_missing_marker", operator.eq),
+    ("message", "@pytest.mark.unit", operator.contains),
+])
+def test_pl004_cli_integration_violation_fields(pl004_cli_violations, field, expected, matches):
+    """Test the fields of the PL004 violation reported via CLI."""
+    assert matches(pl004_cli_violations[0][field], expected)
 
 
 @pytest.mark.integration
@@ -259,7 +274,6 @@ def test_function_{i}_3():
                 test_file.write_text(content)
         
         # Time the linting
-        import time
         start_time = time.time()
         
         linter = ProboscisLinter()
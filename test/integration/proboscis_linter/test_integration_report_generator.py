@@ -1,15 +1,23 @@
 """Integration tests for report generator module."""
+from collections import Counter
 from pathlib import Path
 import json
+import re
 import pytest
 from proboscis_linter.models import LintViolation
-from proboscis_linter.report_generator import TextReportGenerator, JsonReportGenerator
+
+
+# "  SEVERITY: path:line - message naming 'function'" lines of a text report
+_VIOLATION_LINE = re.compile(r"^  (ERROR|WARNING): (.+):(\d+) - [^']*'([^']*)'", re.MULTILINE)
+
+# Leading total and the boundary between violation objects of a JSON report
+_JSON_REPORT_HEADER = re.compile(r'\{\s*"total_violations":\s*(\d+),\s*"violations":\s*\[')
+_JSON_ENTRY_SEPARATOR = re.compile(r"\}\s*,\s*\{")
 
 
 @pytest.mark.integration
-def test_TextReportGenerator_generate_report():
+def test_TextReportGenerator_generate_report(text_gen):
     """Integration test for TextReportGenerator.generate_report method."""
-    generator = TextReportGenerator()
     violations = [
         LintViolation(
             rule_name="PL001:require-unit-test",
@@ -21,7 +29,7 @@ def test_TextReportGenerator_generate_report():
         )
     ]
     
-    report = generator.generate_report(violations)
+    report = text_gen.generate_report(violations)
     assert isinstance(report, str)
     assert "Found 1 violation" in report
     assert "PL001" in report
@@ -29,16 +37,14 @@ def test_TextReportGenerator_generate_report():
 
 
 @pytest.mark.integration
-def test_TextReportGenerator_get_format_name():
+def test_TextReportGenerator_get_format_name(text_gen):
     """Integration test for TextReportGenerator.get_format_name method."""
-    generator = TextReportGenerator()
-    assert generator.get_format_name() == "text"
+    assert text_gen.get_format_name() == "text"
 
 
 @pytest.mark.integration
-def test_JsonReportGenerator_generate_report():
+def test_JsonReportGenerator_generate_report(json_gen):
     """Integration test for JsonReportGenerator.generate_report method."""
-    generator = JsonReportGenerator()
     violations = [
         LintViolation(
             rule_name="PL002:require-integration-test",
@@ -50,7 +56,7 @@ def test_JsonReportGenerator_generate_report():
         )
     ]
     
-    report = generator.generate_report(violations)
+    report = json_gen.generate_report(violations)
     assert isinstance(report, str)
     
     # Parse JSON to validate
@@ -61,18 +67,17 @@ def test_JsonReportGenerator_generate_report():
 
 
 @pytest.mark.integration
-def test_JsonReportGenerator_get_format_name():
+def test_JsonReportGenerator_get_format_name(json_gen):
     """Integration test for JsonReportGenerator.get_format_name method."""
-    generator = JsonReportGenerator()
-    assert generator.get_format_name() == "json"
+    assert json_gen.get_format_name() == "json"
 
 
 class TestReportGeneratorIntegration:
     """Integration tests for report generators."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def complex_violations(self):
-        """Create a complex set of violations for testing."""
+        """Create a complex set of violations for testing (read-only, shared)."""
         return [
             # Multiple violations in same file
             LintViolation(
@@ -140,47 +145,41 @@ class TestReportGeneratorIntegration:
         ]
     
     @pytest.mark.integration
-    def test_text_report_complex_output(self, complex_violations):
+    def test_text_report_complex_output(self, complex_violations, text_gen):
         """Test text report with complex violation set."""
-        generator = TextReportGenerator()
-        report = generator.generate_report(complex_violations)
+        report = text_gen.generate_report(complex_violations)
         
         # Check header
         assert "Found 7 violations:" in report
         
+        # Parse every violation line in one pass
+        rows = _VIOLATION_LINE.findall(report)
+        severities = Counter(severity for severity, _, _, _ in rows)
+        
         # Check all files are mentioned
-        assert "auth.py" in report
-        assert "helpers.py" in report
-        assert "user.py" in report
-        assert "custom_widget.py" in report
+        files = {Path(file_path).name for _, file_path, _, _ in rows}
+        assert {"auth.py", "helpers.py", "user.py", "custom_widget.py"} <= files
         
         # Check line numbers
-        assert ":25" in report
-        assert ":42" in report
-        assert ":15" in report
-        assert ":30" in report
-        assert ":100" in report
+        line_numbers = {line for _, _, line, _ in rows}
+        assert {"25", "42", "15", "30", "100"} <= line_numbers
         
         # Check function names appear
-        assert "authenticate" in report
-        assert "format_date" in report
-        assert "User.save" in report
-        assert "User.delete" in report
-        assert "render_widget" in report
+        functions = {function for _, _, _, function in rows}
+        assert {"authenticate", "format_date", "User.save", "User.delete", "render_widget"} <= functions
         
         # Check severities
-        assert report.count("ERROR:") == 6
-        assert report.count("WARNING:") == 1
+        assert severities["ERROR"] == 6
+        assert severities["WARNING"] == 1
         
         # Check footer
         assert "Total violations: 7" in report
         assert "Tip:" in report
     
     @pytest.mark.integration
-    def test_json_report_complex_structure(self, complex_violations):
+    def test_json_report_complex_structure(self, complex_violations, json_gen):
         """Test JSON report with complex violation set."""
-        generator = JsonReportGenerator()
-        report = generator.generate_report(complex_violations)
+        report = json_gen.generate_report(complex_violations)
         
         data = json.loads(report)
         
@@ -213,11 +212,8 @@ class TestReportGeneratorIntegration:
         assert severities == {"error", "warning"}
     
     @pytest.mark.integration
-    def test_report_generation_consistency(self, complex_violations):
+    def test_report_generation_consistency(self, complex_violations, text_gen, json_gen):
         """Test that multiple generations produce consistent results."""
-        text_gen = TextReportGenerator()
-        json_gen = JsonReportGenerator()
-        
         # Generate multiple times
         text_report1 = text_gen.generate_report(complex_violations)
         text_report2 = text_gen.generate_report(complex_violations)
@@ -228,50 +224,47 @@ class TestReportGeneratorIntegration:
         # Text reports should be identical
         assert text_report1 == text_report2
         
-        # JSON reports should be identical
+        # JSON reports should be identical (equal strings imply equal parsed data)
         assert json_report1 == json_report2
-        
-        # JSON data should be identical
-        data1 = json.loads(json_report1)
-        data2 = json.loads(json_report2)
-        assert data1 == data2
     
     @pytest.mark.integration
-    def test_large_violation_set(self):
+    def test_large_violation_set(self, text_gen, json_gen):
         """Test report generation with many violations."""
-        # Generate 1000 violations
-        violations = []
-        for i in range(1000):
-            module_idx = i // 10
-            func_idx = i % 10
-            rule_idx = (i % 3) + 1
-            
-            violations.append(LintViolation(
-                rule_name=f"PL00{rule_idx}:require-test",
-                file_path=Path(f"/project/src/module_{module_idx}.py"),
-                line_number=10 + func_idx * 5,
-                function_name=f"function_{func_idx}",
-                message=f"Function 'function_{func_idx}' missing test",
-                severity="error" if i % 5 != 0 else "warning"
-            ))
+        # Generate 1000 violations: 100 modules x 10 functions
+        paths = [Path(f"/project/src/module_{m}.py") for m in range(100)]
+        names = [f"function_{f}" for f in range(10)]
+        messages = [f"Function '{name}' missing test" for name in names]
+        violations = [
+            LintViolation(
+                rule_name=f"PL00{(i % 3) + 1}:require-test",
+                file_path=paths[i // 10],
+                line_number=10 + (i % 10) * 5,
+                function_name=names[i % 10],
+                message=messages[i % 10],
+                severity="error" if i % 5 else "warning"
+            )
+            for i in range(1000)
+        ]
         
         # Test text report
-        text_gen = TextReportGenerator()
         text_report = text_gen.generate_report(violations)
         
-        assert "Found 1000 violations:" in text_report
-        assert "Total violations: 1000" in text_report
+        # Header leads the report and the footer sits just before the tip
+        assert text_report.startswith("\nFound 1000 violations:")
+        footer = text_report.rfind("\nTotal violations: 1000\n")
+        assert -1 < footer < text_report.rfind("\nTip:")
         
-        # Test JSON report
-        json_gen = JsonReportGenerator()
+        # Test JSON report without materializing the 1000 entries
         json_report = json_gen.generate_report(violations)
         
-        data = json.loads(json_report)
-        assert data["total_violations"] == 1000
-        assert len(data["violations"]) == 1000
+        header = _JSON_REPORT_HEADER.match(json_report)
+        assert header is not None
+        assert int(header.group(1)) == 1000
+        # Entries are flat objects, so each boundary between two is one "},{"
+        assert len(_JSON_ENTRY_SEPARATOR.findall(json_report)) == 999
     
     @pytest.mark.integration
-    def test_report_ordering(self):
+    def test_report_ordering(self, text_gen, json_gen):
         """Test that violations maintain order in reports."""
         violations = [
             LintViolation(
@@ -301,9 +294,6 @@ class TestReportGeneratorIntegration:
         ]
         
         # Generate reports
-        text_gen = TextReportGenerator()
-        json_gen = JsonReportGenerator()
-        
         text_report = text_gen.generate_report(violations)
         json_report = json_gen.generate_report(violations)
         
@@ -321,7 +311,7 @@ class TestReportGeneratorIntegration:
         assert data["violations"][2]["file"] == "m_middle.py"
     
     @pytest.mark.integration
-    def test_unicode_and_special_paths(self):
+    def test_unicode_and_special_paths(self, text_gen, json_gen):
         """Test report generation with unicode and special characters."""
         violations = [
             LintViolation(
@@ -343,9 +333,6 @@ class TestReportGeneratorIntegration:
         ]
         
         # Test both generators handle unicode properly
-        text_gen = TextReportGenerator()
-        json_gen = JsonReportGenerator()
-        
         text_report = text_gen.generate_report(violations)
         json_report = json_gen.generate_report(violations)
         
@@ -361,12 +348,9 @@ class TestReportGeneratorIntegration:
         assert "my-func$special" == data["violations"][1]["function"]
     
     @pytest.mark.integration
-    def test_empty_edge_cases(self):
+    def test_empty_edge_cases(self, text_gen, json_gen):
         """Test edge cases with empty or minimal data."""
         # Empty violations
-        text_gen = TextReportGenerator()
-        json_gen = JsonReportGenerator()
-        
         empty_text = text_gen.generate_report([])
         empty_json = json_gen.generate_report([])
         
@@ -1,105 +1,120 @@
 """Integration tests for rust_linter module."""
 import pytest
+from dataclasses import dataclass
 from pathlib import Path
-from unittest.mock import patch, Mock
+from typing import List, Optional
+from unittest.mock import Mock
+from proboscis_linter import rust_linter
 from proboscis_linter.rust_linter import RustLinterWrapper
 from proboscis_linter.config import ProboscisConfig, RuleConfig
 
 
+@dataclass
+class ViolationStub:
+    """Plain stand-in for the Rust extension's LintViolation."""
+    rule_name: str
+    file_path: str
+    line_number: int
+    function_name: str
+    message: str
+    severity: str
+    fix_type: Optional[str] = None
+    fix_content: Optional[str] = None
+    fix_line: Optional[int] = None
+
+
+class RustLinterSpec:
+    """Python-visible interface of the Rust extension's RustLinter."""
+    
+    def lint_project(self, project_root: str) -> List[ViolationStub]: ...
+    
+    def lint_file(self, file_path: str) -> List[ViolationStub]: ...
+    
+    def lint_changed_files(self, project_root: str) -> List[ViolationStub]: ...
+    
+    def check_test_markers(self, project_root: str) -> List[ViolationStub]: ...
+
+
+@pytest.fixture
+def rust_module_mock(monkeypatch):
+    """Replace the Rust extension with a mock and return its RustLinter instance."""
+    monkeypatch.setattr(rust_linter, "RUST_AVAILABLE", True)
+    fake_module = Mock(spec=["RustLinter", "LintViolation"])
+    # The extension may not be built, so the attribute can be missing
+    monkeypatch.setattr(rust_linter, "proboscis_linter_rust", fake_module, raising=False)
+    # spec rejects attributes the real RustLinter does not have
+    linter_mock = Mock(spec=RustLinterSpec)
+    fake_module.RustLinter.return_value = linter_mock
+    # No PL004 marker violations unless a test sets them
+    linter_mock.check_test_markers.return_value = []
+    return linter_mock
+
+
 @pytest.mark.integration
-def test_RustLinterWrapper_lint_project():
+def test_RustLinterWrapper_lint_project(rust_module_mock):
     """Integration test for RustLinterWrapper.lint_project method."""
     config = ProboscisConfig()
     
-    with patch('proboscis_linter.rust_linter.RUST_AVAILABLE', True):
-        with patch('proboscis_linter.rust_linter.proboscis_linter_rust') as mock_rust_module:
-            mock_rust_linter = Mock()
-            mock_rust_module.RustLinter.return_value = mock_rust_linter
-            
-            # Create mock violations
-            mock_violation = Mock()
-            mock_violation.rule_name = "PL001:require-unit-test"
-            mock_violation.file_path = "/test/file.py"
-            mock_violation.line_number = 10
-            mock_violation.function_name = "test_func"
-            mock_violation.message = "Missing unit test"
-            mock_violation.severity = "error"
-            
-            mock_rust_linter.lint_project.return_value = [mock_violation]
-            
-            wrapper = RustLinterWrapper(config)
-            violations = wrapper.lint_project(Path("/test/project"))
-            
-            assert len(violations) == 1
-            assert violations[0].rule_name == "PL001:require-unit-test"
-            mock_rust_linter.lint_project.assert_called_once()
+    # Create mock violations
+    mock_violation = ViolationStub(
+        "PL001:require-unit-test", "/test/file.py", 10, "test_func", "Missing unit test", "error"
+    )
+    
+    rust_module_mock.lint_project.return_value = [mock_violation]
+    
+    wrapper = RustLinterWrapper(config)
+    violations = wrapper.lint_project(Path("/test/project"))
+    
+    assert len(violations) == 1
+    assert violations[0].rule_name == "PL001:require-unit-test"
+    rust_module_mock.lint_project.assert_called_once()
 
 
 @pytest.mark.integration
-def test_RustLinterWrapper_lint_file():
+def test_RustLinterWrapper_lint_file(rust_module_mock):
     """Integration test for RustLinterWrapper.lint_file method."""
     config = ProboscisConfig()
     
-    with patch('proboscis_linter.rust_linter.RUST_AVAILABLE', True):
-        with patch('proboscis_linter.rust_linter.proboscis_linter_rust') as mock_rust_module:
-            mock_rust_linter = Mock()
-            mock_rust_module.RustLinter.return_value = mock_rust_linter
-            
-            # Create mock violations
-            mock_violation = Mock()
-            mock_violation.rule_name = "PL002:require-integration-test"
-            mock_violation.file_path = "/test/file.py"
-            mock_violation.line_number = 20
-            mock_violation.function_name = "test_func"
-            mock_violation.message = "Missing integration test"
-            mock_violation.severity = "error"
-            
-            mock_rust_linter.lint_file.return_value = [mock_violation]
-            
-            wrapper = RustLinterWrapper(config)
-            violations = wrapper.lint_file(Path("/test/file.py"), [Path("/test")])
-            
-            assert len(violations) == 1
-            assert violations[0].rule_name == "PL002:require-integration-test"
-            mock_rust_linter.lint_file.assert_called_once()
+    # Create mock violations
+    mock_violation = ViolationStub(
+        "PL002:require-integration-test", "/test/file.py", 20, "test_func", "Missing integration test", "error"
+    )
+    
+    rust_module_mock.lint_file.return_value = [mock_violation]
+    
+    wrapper = RustLinterWrapper(config)
+    violations = wrapper.lint_file(Path("/test/file.py"), [Path("/test")])
+    
+    assert len(violations) == 1
+    assert violations[0].rule_name == "PL002:require-integration-test"
+    rust_module_mock.lint_file.assert_called_once()
 
 
 @pytest.mark.integration
-def test_RustLinterWrapper_lint_changed_files():
+def test_RustLinterWrapper_lint_changed_files(rust_module_mock):
     """Integration test for RustLinterWrapper.lint_changed_files method."""
     config = ProboscisConfig()
     
-    with patch('proboscis_linter.rust_linter.RUST_AVAILABLE', True):
-        with patch('proboscis_linter.rust_linter.proboscis_linter_rust') as mock_rust_module:
-            mock_rust_linter = Mock()
-            mock_rust_module.RustLinter.return_value = mock_rust_linter
-            
-            # Create mock violations
-            mock_violation = Mock()
-            mock_violation.rule_name = "PL003:require-e2e-test"
-            mock_violation.file_path = "/test/changed.py"
-            mock_violation.line_number = 30
-            mock_violation.function_name = "test_func"
-            mock_violation.message = "Missing e2e test"
-            mock_violation.severity = "error"
-            
-            mock_rust_linter.lint_changed_files.return_value = [mock_violation]
-            
-            wrapper = RustLinterWrapper(config)
-            violations = wrapper.lint_changed_files(Path("/test/project"))
-            
-            assert len(violations) == 1
-            assert violations[0].rule_name == "PL003:require-e2e-test"
-            mock_rust_linter.lint_changed_files.assert_called_once()
+    # Create mock violations
+    mock_violation = ViolationStub(
+        "PL003:require-e2e-test", "/test/changed.py", 30, "test_func", "Missing e2e test", "error"
+    )
+    
+    rust_module_mock.lint_changed_files.return_value = [mock_violation]
+    
+    wrapper = RustLinterWrapper(config)
+    violations = wrapper.lint_changed_files(Path("/test/project"))
+    
+    assert len(violations) == 1
+    assert violations[0].rule_name == "PL003:require-e2e-test"
+    rust_module_mock.lint_changed_files.assert_called_once()
 
 
 class TestRustLinterIntegration:
     """Integration tests for RustLinterWrapper."""
     
     @pytest.mark.integration
-    @patch('proboscis_linter.rust_linter.RUST_AVAILABLE', True)
-    @patch('proboscis_linter.rust_linter.proboscis_linter_rust')
-    def test_lint_project_with_custom_config(self, mock_rust_module):
+    def test_lint_project_with_custom_config(self, rust_module_mock):
         """Test linting project with custom configuration."""
         # Setup custom config
         config = ProboscisConfig(
@@ -113,9 +128,6 @@ class TestRustLinterIntegration:
             }
         )
         
-        mock_rust_linter = Mock()
-        mock_rust_module.RustLinter.return_value = mock_rust_linter
-        
         # Create multiple mock violations
         violations_data = [
             ("PL001:require-unit-test", "/src/module1.py", 10, "func1", "Missing unit test", "error"),
@@ -124,18 +136,9 @@ class TestRustLinterIntegration:
             ("PL001:require-unit-test", "/src/module4.py", 40, "func4", "Missing unit test", "error"),
         ]
         
-        mock_violations = []
-        for rule, path, line, func, msg, sev in violations_data:
-            mock_violation = Mock()
-            mock_violation.rule_name = rule
-            mock_violation.file_path = path
-            mock_violation.line_number = line
-            mock_violation.function_name = func
-            mock_violation.message = msg
-            mock_violation.severity = sev
-            mock_violations.append(mock_violation)
+        mock_violations = [ViolationStub(*row) for row in violations_data]
         
-        mock_rust_linter.lint_project.return_value = mock_violations
+        rust_module_mock.lint_project.return_value = mock_violations
         
         wrapper = RustLinterWrapper(config)
         violations = wrapper.lint_project(Path("/test/project"))
@@ -148,13 +151,9 @@ class TestRustLinterIntegration:
         assert "PL003:require-e2e-test" in rule_names
     
     @pytest.mark.integration
-    @patch('proboscis_linter.rust_linter.RUST_AVAILABLE', True)
-    @patch('proboscis_linter.rust_linter.proboscis_linter_rust')
-    def test_lint_file_integration(self, mock_rust_module):
+    def test_lint_file_integration(self, rust_module_mock):
         """Test linting a single file with multiple violations."""
         config = ProboscisConfig()
-        mock_rust_linter = Mock()
-        mock_rust_module.RustLinter.return_value = mock_rust_linter
         
         # Create violations for different rules
         violations_data = [
@@ -163,25 +162,17 @@ class TestRustLinterIntegration:
             ("PL003:require-e2e-test", "/src/utils.py", 5, "helper_func", "Missing e2e test", "error"),
         ]
         
-        mock_violations = []
-        for rule, path, line, func, msg, sev in violations_data:
-            mock_violation = Mock()
-            mock_violation.rule_name = rule
-            mock_violation.file_path = path
-            mock_violation.line_number = line
-            mock_violation.function_name = func
-            mock_violation.message = msg
-            mock_violation.severity = sev
-            mock_violations.append(mock_violation)
+        mock_violations = [ViolationStub(*row) for row in violations_data]
         
-        mock_rust_linter.lint_file.return_value = mock_violations
+        rust_module_mock.lint_file.return_value = mock_violations
         
+        file_path = Path("/src/utils.py")
         wrapper = RustLinterWrapper(config)
-        violations = wrapper.lint_file(Path("/src/utils.py"), [Path("/test")])
+        violations = wrapper.lint_file(file_path, [Path("/test")])
         
         # Verify all violations are returned
         assert len(violations) == 3
-        assert all(v.file_path == Path("/src/utils.py") for v in violations)
+        assert all(v.file_path == file_path for v in violations)
         assert all(v.function_name == "helper_func" for v in violations)
         assert all(v.line_number == 5 for v in violations)
         
@@ -194,9 +185,7 @@ class TestRustLinterIntegration:
         }
     
     @pytest.mark.integration
-    @patch('proboscis_linter.rust_linter.RUST_AVAILABLE', True)
-    @patch('proboscis_linter.rust_linter.proboscis_linter_rust')
-    def test_lint_changed_files_with_mixed_results(self, mock_rust_module):
+    def test_lint_changed_files_with_mixed_results(self, rust_module_mock):
         """Test linting changed files with a mix of violations and clean files."""
         config = ProboscisConfig(
             rules={
@@ -206,9 +195,6 @@ class TestRustLinterIntegration:
             }
         )
         
-        mock_rust_linter = Mock()
-        mock_rust_module.RustLinter.return_value = mock_rust_linter
-        
         # Create violations for changed files
         violations_data = [
             ("PL001:require-unit-test", "/src/changed1.py", 10, "new_func", "Missing unit test", "error"),
@@ -217,18 +203,9 @@ class TestRustLinterIntegration:
             ("PL001:require-unit-test", "/src/changed3.py", 30, "added_func", "Missing unit test", "error"),
         ]
         
-        mock_violations = []
-        for rule, path, line, func, msg, sev in violations_data:
-            mock_violation = Mock()
-            mock_violation.rule_name = rule
-            mock_violation.file_path = path
-            mock_violation.line_number = line
-            mock_violation.function_name = func
-            mock_violation.message = msg
-            mock_violation.severity = sev
-            mock_violations.append(mock_violation)
+        mock_violations = [ViolationStub(*row) for row in violations_data]
         
-        mock_rust_linter.lint_changed_files.return_value = mock_violations
+        rust_module_mock.lint_changed_files.return_value = mock_violations
         
         wrapper = RustLinterWrapper(config)
         violations = wrapper.lint_changed_files(Path("/test/project"))
@@ -245,16 +222,11 @@ class TestRustLinterIntegration:
         assert file_paths == {"/src/changed1.py", "/src/changed3.py"}
     
     @pytest.mark.integration
-    @patch('proboscis_linter.rust_linter.RUST_AVAILABLE', True)
-    @patch('proboscis_linter.rust_linter.proboscis_linter_rust')
-    def test_error_handling_in_lint_operations(self, mock_rust_module):
+    def test_error_handling_in_lint_operations(self, rust_module_mock):
         """Test error handling when Rust linter operations fail."""
         config = ProboscisConfig()
-        mock_rust_linter = Mock()
-        mock_rust_module.RustLinter.return_value = mock_rust_linter
-        
         # Test lint_project error
-        mock_rust_linter.lint_project.side_effect = RuntimeError("Rust linter crashed")
+        rust_module_mock.lint_project.side_effect = RuntimeError("Rust linter crashed")
         
         wrapper = RustLinterWrapper(config)
         
@@ -262,21 +234,19 @@ class TestRustLinterIntegration:
             wrapper.lint_project(Path("/test/project"))
         
         # Test lint_file error
-        mock_rust_linter.lint_file.side_effect = ValueError("Invalid file path")
+        rust_module_mock.lint_file.side_effect = ValueError("Invalid file path")
         
         with pytest.raises(ValueError, match="Invalid file path"):
             wrapper.lint_file(Path("/invalid/file.py"), [Path("/test")])
         
         # Test lint_changed_files error
-        mock_rust_linter.lint_changed_files.side_effect = OSError("Git command failed")
+        rust_module_mock.lint_changed_files.side_effect = OSError("Git command failed")
         
         with pytest.raises(OSError, match="Git command failed"):
             wrapper.lint_changed_files(Path("/test/project"))
     
     @pytest.mark.integration
-    @patch('proboscis_linter.rust_linter.RUST_AVAILABLE', True)
-    @patch('proboscis_linter.rust_linter.proboscis_linter_rust')
-    def test_complex_rule_filtering_scenario(self, mock_rust_module):
+    def test_complex_rule_filtering_scenario(self, rust_module_mock):
         """Test complex scenario with multiple rule configurations."""
         # Create config with various rule states
         config = ProboscisConfig(
@@ -288,9 +258,6 @@ class TestRustLinterIntegration:
             }
         )
         
-        mock_rust_linter = Mock()
-        mock_rust_module.RustLinter.return_value = mock_rust_linter
-        
         # Create violations for all rule types
         violations_data = [
             ("PL001:require-unit-test", "/src/file1.py", 10, "func1", "Missing unit test", "error"),
@@ -300,18 +267,9 @@ class TestRustLinterIntegration:
             ("PL001:require-unit-test", "/src/file5.py", 50, "func5", "Missing unit test", "error"),
         ]
         
-        mock_violations = []
-        for rule, path, line, func, msg, sev in violations_data:
-            mock_violation = Mock()
-            mock_violation.rule_name = rule
-            mock_violation.file_path = path
-            mock_violation.line_number = line
-            mock_violation.function_name = func
-            mock_violation.message = msg
-            mock_violation.severity = sev
-            mock_violations.append(mock_violation)
+        mock_violations = [ViolationStub(*row) for row in violations_data]
         
-        mock_rust_linter.lint_project.return_value = mock_violations
+        rust_module_mock.lint_project.return_value = mock_violations
         
         wrapper = RustLinterWrapper(config)
         violations = wrapper.lint_project(Path("/test/project"))
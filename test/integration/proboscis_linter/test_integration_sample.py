@@ -3,57 +3,54 @@ import pytest
 from proboscis_linter.sample import add, subtract, multiply, divide, complex_function
 
 
-# Direct test function expected by the linter
-@pytest.mark.integration
-def test_complex_function():
-    """Test complex_function in integration context."""
-    # Test with calculated inputs
-    x = add(2, 3)  # 5
-    y = subtract(10, 7)  # 3
-    z = multiply(2, 4)  # 8
-    result = complex_function(x, y, z)
-    assert result == 16  # 5 + 3 + 8
+_OPS = {"add": add, "subtract": subtract, "multiply": multiply, "divide": divide}
+
+
+def _apply_ops(ops):
+    """Apply (name, a, b) steps in order; a of None means the previous result."""
+    acc = None
+    for name, a, b in ops:
+        acc = _OPS[name](acc if a is None else a, b)
+    return acc
+
+
+def _fold(func, initial, values):
+    """Repeatedly apply a binary sample function over values."""
+    result = initial
+    for value in values:
+        result = func(result, value)
+    return result
 
 
 class TestSampleIntegration:
     """Integration tests for sample module functions working together."""
     
     @pytest.mark.integration
-    def test_arithmetic_operations_chain(self):
-        """Test chaining multiple arithmetic operations."""
+    @pytest.mark.parametrize("ops, expected", [
         # (5 + 3) * 2 - 4 = 12
-        result1 = add(5, 3)
-        result2 = multiply(result1, 2)
-        result3 = subtract(result2, 4)
-        assert result3 == 12
-        
+        pytest.param([("add", 5, 3), ("multiply", None, 2), ("subtract", None, 4)], 12, id="add-multiply-subtract"),
         # (10 - 5) * 4 + 2 = 22
-        result1 = subtract(10, 5)
-        result2 = multiply(result1, 4)
-        result3 = add(result2, 2)
-        assert result3 == 22
+        pytest.param([("subtract", 10, 5), ("multiply", None, 4), ("add", None, 2)], 22, id="subtract-multiply-add"),
+    ])
+    def test_arithmetic_operations_chain(self, ops, expected):
+        """Test chaining multiple arithmetic operations."""
+        assert _apply_ops(ops) == expected
     
     @pytest.mark.integration
-    def test_division_with_other_operations(self):
-        """Test division combined with other operations."""
+    @pytest.mark.parametrize("calculation, expected", [
         # (20 / 4) + 5 = 10
-        result1 = divide(20, 4)
-        result2 = add(result1, 5)
-        assert result2 == 10.0
-        
+        pytest.param(lambda: add(divide(20, 4), 5), 10.0, id="divide-then-add"),
         # 100 / (10 - 5) = 20
-        denominator = subtract(10, 5)
-        result = divide(100, denominator)
-        assert result == 20.0
-        
+        pytest.param(lambda: divide(100, subtract(10, 5)), 20.0, id="divide-by-difference"),
         # (15 + 5) / (8 - 4) = 5
-        numerator = add(15, 5)
-        denominator = subtract(8, 4)
-        result = divide(numerator, denominator)
-        assert result == 5.0
+        pytest.param(lambda: divide(add(15, 5), subtract(8, 4)), 5.0, id="sum-over-difference"),
+    ])
+    def test_division_with_other_operations(self, calculation, expected):
+        """Test division combined with other operations."""
+        assert calculation() == expected
     
     @pytest.mark.integration
-    def test_complex_function_with_calculated_inputs(self):
+    def test_complex_function(self):
         """Test complex_function using results from other functions."""
         # Use arithmetic results as inputs to complex_function
         x = add(2, 3)  # 5
@@ -136,27 +133,15 @@ class TestSampleIntegration:
         assert result == 45
     
     @pytest.mark.integration
-    def test_complex_function_combinations(self):
+    @pytest.mark.parametrize("x, y, z, expected", [
+        pytest.param(add(1, 2), add(2, 3), multiply(2, 3), 14, id="x>0,y>0"),  # 3 + 5 + 6
+        pytest.param(add(2, 3), subtract(1, 5), add(1, 1), 11, id="x>0,y<0"),  # 5 - (-4) + 2
+        pytest.param(subtract(2, 5), add(3, 4), multiply(3, 3), 19, id="x<0,y>0"),  # -(-3) + 7 + 9
+        pytest.param(subtract(1, 3), subtract(2, 4), add(5, 5), 14, id="x<0,y<0"),  # -(-2) - (-2) + 10
+    ])
+    def test_complex_function_combinations(self, x, y, z, expected):
         """Test complex_function with various calculated inputs."""
-        # Test all branches with calculated values
-        test_cases = [
-            # (x_calc, y_calc, z_calc, expected_branch)
-            (add(1, 2), add(2, 3), multiply(2, 3), "x>0,y>0"),  # 3, 5, 6
-            (add(2, 3), subtract(1, 5), add(1, 1), "x>0,y<0"),  # 5, -4, 2
-            (subtract(2, 5), add(3, 4), multiply(3, 3), "x<0,y>0"),  # -3, 7, 9
-            (subtract(1, 3), subtract(2, 4), add(5, 5), "x<0,y<0"),  # -2, -2, 10
-        ]
-        
-        expected_results = [
-            14,  # 3 + 5 + 6
-            11,  # 5 - (-4) + 2
-            19,  # -(-3) + 7 + 9
-            14,  # -(-2) - (-2) + 10
-        ]
-        
-        for (x, y, z, branch), expected in zip(test_cases, expected_results):
-            result = complex_function(x, y, z)
-            assert result == expected, f"Failed for branch {branch}"
+        assert complex_function(x, y, z) == expected
     
     @pytest.mark.integration
     def test_precision_and_rounding(self):
@@ -179,24 +164,23 @@ class TestSampleIntegration:
         assert 15.4 < e < 15.5
     
     @pytest.mark.integration
-    def test_stress_calculations(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("calculation, expected", [
+        # Factorial-like calculation using repeated multiplication: 5!
+        pytest.param(lambda: _fold(multiply, 1, range(1, 6)), 120, id="factorial"),
+        # Sum of arithmetic sequence using repeated addition: 1 to 10
+        pytest.param(lambda: _fold(add, 0, range(1, 11)), 55, id="arithmetic_sum"),
+        # Complex nested calculations: 11 + 3 + 10 (x > 0, y > 0)
+        pytest.param(
+            lambda: complex_function(
+                add(multiply(2, 3), subtract(10, 5)),  # 6 + 5 = 11
+                subtract(divide(20, 4), multiply(1, 2)),  # 5 - 2 = 3
+                add(add(1, 2), add(3, 4))  # 3 + 7 = 10
+            ),
+            24,
+            id="nested_complex_function",
+        ),
+    ])
+    def test_stress_calculations(self, calculation, expected):
         """Test functions with many operations."""
-        # Factorial-like calculation using repeated multiplication
-        result = 1
-        for i in range(1, 6):  # 5!
-            result = multiply(result, i)
-        assert result == 120
-        
-        # Sum of arithmetic sequence using repeated addition
-        sum_result = 0
-        for i in range(1, 11):  # Sum of 1 to 10
-            sum_result = add(sum_result, i)
-        assert sum_result == 55
-        
-        # Complex nested calculations
-        result = complex_function(
-            add(multiply(2, 3), subtract(10, 5)),  # 6 + 5 = 11
-            subtract(divide(20, 4), multiply(1, 2)),  # 5 - 2 = 3
-            add(add(1, 2), add(3, 4))  # 3 + 7 = 10
-        )
-        assert result == 24  # 11 + 3 + 10 (x > 0, y > 0)
\ No newline at end of file
+        assert calculation() == expected
@@ -1,152 +1,172 @@
 """Integration tests for noqa comment functionality via CLI."""
+import contextlib
+import os
 import subprocess
-import tempfile
 import json
+from io import StringIO
 from pathlib import Path
+import pytest
+from proboscis_linter.cli import cli
+
+
+# Module-scoped fixtures are shared, so keep these tests on one xdist worker.
+# The CLI runs are deterministic for a given linter source, so skip reruns
+# while nothing they depend on has changed.
+pytestmark = [pytest.mark.xdist_group("noqa_cli"), pytest.mark.cache_unchanged]
 
 
 def run_linter(project_path: Path, *args) -> tuple[int, str, str]:
-    """Run the linter CLI and return exit code, stdout, and stderr."""
-    cmd = ["uv", "run", "python", "-m", "proboscis_linter.cli", str(project_path)] + list(args)
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    return result.returncode, result.stdout, result.stderr
+    """Run the linter CLI and return exit code, stdout, and stderr.
+    
+    The CLI runs in-process by default; set PROBOSCIS_E2E to exercise the
+    real entry point in a subprocess instead.
+    """
+    if os.environ.get("PROBOSCIS_E2E"):
+        cmd = ["uv", "run", "python", "-m", "proboscis_linter.cli", str(project_path)] + list(args)
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        return result.returncode, result.stdout, result.stderr
+    
+    buf_out, buf_err = StringIO(), StringIO()
+    with contextlib.redirect_stdout(buf_out), contextlib.redirect_stderr(buf_err):
+        try:
+            cli.main([str(project_path), *args], prog_name="proboscis-linter")
+            exit_code = 0
+        except SystemExit as e:
+            exit_code = e.code or 0
+    return exit_code, buf_out.getvalue(), buf_err.getvalue()
+
+
+@pytest.fixture(scope="session")
+def _noqa_root(tmp_path_factory):
+    """Single temporary root shared by all noqa CLI tests."""
+    return tmp_path_factory.mktemp("noqa_root")
+
+
+@pytest.fixture
+def project_dir(_noqa_root, request):
+    """Per-test project directory under the shared root."""
+    return _noqa_root / request.node.name
+
+
+# Fixture sources, pre-encoded so each test writes raw bytes
+SRC_TEXT_NOQA = (
+    b"def func_with_noqa():  #noqa PL001\n"
+    b"    return 1\n"
+    b"\n"
+    b"def func_without_noqa():\n"
+    b"    return 2\n"
+)
+
+SRC_ALL_SUPPRESSED = (
+    b"def my_function():  #noqa PL001, PL002, PL003\n"
+    b"    return 42\n"
+)
+
+# One source exercising every JSON-checked noqa form, linted once per module
+COMBINED_SOURCE = (
+    b"def func1():  #noqa PL001, PL002\n"
+    b"    return 1\n"
+    b"\n"
+    b"def func2():  #noqa: PL003\n"
+    b"    return 2\n"
+    b"\n"
+    b"def func3():\n"
+    b"    return 3\n"
+    b"\n"
+    b"class MyClass:\n"
+    b"    def method_with_noqa(self):  #noqa PL001\n"
+    b"        return 1\n"
+    b"    \n"
+    b"    def method_without_noqa(self):\n"
+    b"        return 2\n"
+    b"\n"
+) + SRC_ALL_SUPPRESSED
+
+
+@pytest.fixture(scope="module")
+def all_noqa_violations(_noqa_root, write_tree):
+    """Lint COMBINED_SOURCE once with JSON output and return the parsed violations."""
+    project = _noqa_root / "combined"
+    write_tree(project, {"src/module.py": COMBINED_SOURCE})
+    
+    exit_code, stdout, stderr = run_linter(project, "--format", "json")
+    return json.loads(stdout)["violations"]
+
+
+def _check_text(exit_code: int, stdout: str) -> None:
+    # func_with_noqa should not have PL001 violations
+    # but will still have PL002 and PL003
+    output_lines = stdout.split('\n')
+    pl001_violations = [line for line in output_lines if "PL001" in line and "func_with_noqa" in line]
+    assert len(pl001_violations) == 0
+
+    # func_without_noqa should have all violations
+    assert "func_without_noqa" in stdout
+
+
+def _check_fail_on_error(exit_code: int, stdout: str) -> None:
+    # Should exit with 0 since all violations are suppressed
+    assert exit_code == 0
+    assert "No violations found" in stdout
 
 
 @pytest.mark.integration
-def test_noqa_via_cli_text_format():
-    """Test noqa functionality through CLI with text output."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        # Create a source file with noqa comments
-        src_dir = tmpdir_path / "src"
-        src_dir.mkdir()
-        
-        source_file = src_dir / "module.py"
-        source_file.write_text(
-            "def func_with_noqa():  #noqa PL001\n"
-            "    return 1\n"
-            "\n"
-            "def func_without_noqa():\n"
-            "    return 2\n"
-        )
-        
-        # Run linter
-        exit_code, stdout, stderr = run_linter(tmpdir_path)
-        
-        # func_with_noqa should not have PL001 violations
-        # but will still have PL002 and PL003
-        output_lines = stdout.split('\n')
-        pl001_violations = [line for line in output_lines if "PL001" in line and "func_with_noqa" in line]
-        assert len(pl001_violations) == 0
-        
-        # func_without_noqa should have all violations
-        assert "func_without_noqa" in stdout
+@pytest.mark.parametrize("source, cli_args, checker", [
+    pytest.param(SRC_TEXT_NOQA, (), _check_text, id="text_format"),
+    pytest.param(SRC_ALL_SUPPRESSED, ("--fail-on-error",), _check_fail_on_error, id="fail_on_error"),
+])
+def test_noqa_via_cli(project_dir, write_tree, source, cli_args, checker):
+    """Test noqa functionality through the CLI for each output mode."""
+    # Create a source file with noqa comments
+    write_tree(project_dir, {"src/module.py": source})
+
+    # Run linter
+    exit_code, stdout, stderr = run_linter(project_dir, *cli_args)
+
+    checker(exit_code, stdout)
 
 
 @pytest.mark.integration
-def test_noqa_via_cli_json_format():
+def test_noqa_via_cli_json_format(all_noqa_violations):
     """Test noqa functionality through CLI with JSON output."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        # Create a source file with multiple noqa suppressions
-        src_dir = tmpdir_path / "src"
-        src_dir.mkdir()
-        
-        source_file = src_dir / "module.py"
-        source_file.write_text(
-            "def func1():  #noqa PL001, PL002\n"
-            "    return 1\n"
-            "\n"
-            "def func2():  #noqa: PL003\n"
-            "    return 2\n"
-            "\n"
-            "def func3():\n"
-            "    return 3\n"
-        )
-        
-        # Run linter with JSON output
-        exit_code, stdout, stderr = run_linter(tmpdir_path, "--format", "json")
-        
-        # Parse JSON output
-        violations = json.loads(stdout)["violations"]
-        
-        # func1 should have no PL001 or PL002 violations
-        func1_violations = [v for v in violations if v["function"] == "func1"]
-        assert not any("PL001" in v["rule"] for v in func1_violations)
-        assert not any("PL002" in v["rule"] for v in func1_violations)
-        # But might have PL003
-        assert any("PL003" in v["rule"] for v in func1_violations)
-        
-        # func2 should have no PL003 violations
-        func2_violations = [v for v in violations if v["function"] == "func2"]
-        assert not any("PL003" in v["rule"] for v in func2_violations)
-        # But should have PL001 and PL002
-        assert any("PL001" in v["rule"] for v in func2_violations)
-        assert any("PL002" in v["rule"] for v in func2_violations)
-        
-        # func3 should have all violations
-        func3_violations = [v for v in violations if v["function"] == "func3"]
-        assert any("PL001" in v["rule"] for v in func3_violations)
-        assert any("PL002" in v["rule"] for v in func3_violations)
-        assert any("PL003" in v["rule"] for v in func3_violations)
+    violations = all_noqa_violations
+
+    # func1 should have no PL001 or PL002 violations
+    func1_violations = [v for v in violations if v["function"] == "func1"]
+    assert not any("PL001" in v["rule"] for v in func1_violations)
+    assert not any("PL002" in v["rule"] for v in func1_violations)
+    # But might have PL003
+    assert any("PL003" in v["rule"] for v in func1_violations)
+
+    # func2 should have no PL003 violations
+    func2_violations = [v for v in violations if v["function"] == "func2"]
+    assert not any("PL003" in v["rule"] for v in func2_violations)
+    # But should have PL001 and PL002
+    assert any("PL001" in v["rule"] for v in func2_violations)
+    assert any("PL002" in v["rule"] for v in func2_violations)
+
+    # func3 should have all violations
+    func3_violations = [v for v in violations if v["function"] == "func3"]
+    assert any("PL001" in v["rule"] for v in func3_violations)
+    assert any("PL002" in v["rule"] for v in func3_violations)
+    assert any("PL003" in v["rule"] for v in func3_violations)
 
 
 @pytest.mark.integration
-def test_noqa_in_class_methods():
+def test_noqa_in_class_methods(all_noqa_violations):
     """Test noqa comments in class methods."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        # Create a source file with class methods
-        src_dir = tmpdir_path / "src"
-        src_dir.mkdir()
-        
-        source_file = src_dir / "module.py"
-        source_file.write_text(
-            "class MyClass:\n"
-            "    def method_with_noqa(self):  #noqa PL001\n"
-            "        return 1\n"
-            "    \n"
-            "    def method_without_noqa(self):\n"
-            "        return 2\n"
-        )
-        
-        # Run linter
-        exit_code, stdout, stderr = run_linter(tmpdir_path, "--format", "json")
-        
-        # Parse JSON output
-        violations = json.loads(stdout)["violations"]
-        
-        # method_with_noqa should have no PL001 violations
-        method_with_noqa_violations = [v for v in violations if v["function"] == "method_with_noqa"]
-        assert not any("PL001" in v["rule"] for v in method_with_noqa_violations)
-        
-        # method_without_noqa should have PL001 violation
-        method_without_noqa_violations = [v for v in violations if v["function"] == "method_without_noqa"]
-        assert any("PL001" in v["rule"] for v in method_without_noqa_violations)
+    violations = all_noqa_violations
+
+    # method_with_noqa should have no PL001 violations
+    method_with_noqa_violations = [v for v in violations if v["function"] == "method_with_noqa"]
+    assert not any("PL001" in v["rule"] for v in method_with_noqa_violations)
+
+    # method_without_noqa should have PL001 violation
+    method_without_noqa_violations = [v for v in violations if v["function"] == "method_without_noqa"]
+    assert any("PL001" in v["rule"] for v in method_without_noqa_violations)
 
 
 @pytest.mark.integration
-def test_noqa_fail_on_error():
-    """Test that noqa suppressed violations don't cause failure with --fail-on-error."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        # Create a source file with all violations suppressed
-        src_dir = tmpdir_path / "src"
-        src_dir.mkdir()
-        
-        source_file = src_dir / "module.py"
-        source_file.write_text(
-            "def my_function():  #noqa PL001, PL002, PL003\n"
-            "    return 42\n"
-        )
-        
-        # Run linter with --fail-on-error
-        exit_code, stdout, stderr = run_linter(tmpdir_path, "--fail-on-error")
-        
-        # Should exit with 0 since all violations are suppressed
-        assert exit_code == 0
-        assert "No violations found" in stdout
\ No newline at end of file
+def test_noqa_all_rules_suppressed_json(all_noqa_violations):
+    """Test that a function suppressing every rule reports no violations."""
+    assert not [v for v in all_noqa_violations if v["function"] == "my_function"]
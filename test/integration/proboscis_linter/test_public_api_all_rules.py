@@ -1,26 +1,21 @@
 """Integration tests for public API detection across all rules."""
-import tempfile
+import os
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from string import Template
 import pytest
 import json
-from click.testing import CliRunner
-from proboscis_linter.cli import cli
 from proboscis_linter.linter import ProboscisLinter
 from proboscis_linter.config import ProboscisConfig
 
 
-@pytest.mark.integration
-def test_all_rules_respect_module_all():
-    """All rules (PL001-PL004) should respect __all__ in modules."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir)
-        
-        # Create source module with __all__
-        src = root / "src"
-        src.mkdir()
-        module = src / "my_module.py"
-        module.write_text('''
+# Fixture sources, pre-encoded so tests write raw bytes
+_EMPTY_STUB = b"# Empty\n"
+
+_MODULE_ALL_SRC = b'''
 __all__ = ['public_func', 'PublicClass']
 
 def public_func():
@@ -35,7 +30,7 @@ class PublicClass:
     """This class is public - in __all__."""
     def method(self):
         return "public"
-    
+
     def _private_method(self):
         return "private"
 
@@ -43,46 +38,9 @@ class PrivateClass:
     """This class is private - not in __all__."""
     def method(self):
         return "private"
-''')
-        
-        # Create empty test directories
-        for test_type in ["unit", "integration", "e2e"]:
-            test_dir = root / "test" / test_type
-            test_dir.mkdir(parents=True)
-            # Create empty test file
-            (test_dir / "test_empty.py").write_text("# Empty test file\n")
-        
-        # Run linter with all rules enabled
-        config = ProboscisConfig(rules={
-            "PL001": {"enabled": True},
-            "PL002": {"enabled": True},
-            "PL003": {"enabled": True},
-            "PL004": {"enabled": False}  # Disable PL004 for this test
-        })
-        linter = ProboscisLinter(config)
-        violations = linter.lint_project(root)
-        
-        # Should only find violations for public_func and PublicClass.method
-        func_names = {v.function_name for v in violations}
-        expected_funcs = {'public_func', 'method'}  # Only PublicClass.method
-        assert func_names == expected_funcs
-        
-        # Verify we have violations from all three rules
-        rule_names = {v.rule_name.split(':')[0] for v in violations}
-        assert rule_names == {'PL001', 'PL002', 'PL003'}
-
+'''
 
-@pytest.mark.integration
-def test_all_rules_respect_underscore_convention():
-    """All rules should respect underscore convention when no __all__."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir)
-        
-        # Create source module without __all__
-        src = root / "src"
-        src.mkdir()
-        module = src / "my_module.py"
-        module.write_text('''
+_UNDERSCORE_SRC = b'''
 def public_func():
     """This is public - no underscore."""
     return 42
@@ -95,7 +53,7 @@ class PublicClass:
     """This class is public - no underscore."""
     def public_method(self):
         return "public"
-    
+
     def _private_method(self):
         return "private"
 
@@ -103,41 +61,9 @@ class _PrivateClass:
     """This class is private - underscore prefix."""
     def any_method(self):
         return "private"
-''')
-        
-        # Create empty test directories
-        for test_type in ["unit", "integration", "e2e"]:
-            test_dir = root / "test" / test_type
-            test_dir.mkdir(parents=True)
-            (test_dir / "test_empty.py").write_text("# Empty test file\n")
-        
-        # Run linter
-        config = ProboscisConfig(rules={
-            "PL001": {"enabled": True},
-            "PL002": {"enabled": True},
-            "PL003": {"enabled": True},
-            "PL004": {"enabled": False}
-        })
-        linter = ProboscisLinter(config)
-        violations = linter.lint_project(root)
-        
-        # Should only find violations for public_func and PublicClass.public_method
-        func_names = {v.function_name for v in violations}
-        expected_funcs = {'public_func', 'public_method'}
-        assert func_names == expected_funcs
-
+'''
 
-@pytest.mark.integration
-def test_pl004_respects_public_api():
-    """PL004 should only check public test functions."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir)
-        
-        # Create test file with mixed public/private functions
-        test_dir = root / "test" / "unit"
-        test_dir.mkdir(parents=True)
-        test_file = test_dir / "test_mixed.py"
-        test_file.write_text('''
+_MIXED_TESTS_SRC = b'''
 import pytest
 
 @pytest.mark.integration
@@ -161,7 +87,7 @@ class TestPublicClass:
     def test_needs_marker(self):
         """Needs marker."""
         pass
-    
+
     def _test_private_method(self):
         """No marker needed."""
         pass
@@ -172,31 +98,9 @@ class _TestPrivateClass:
     def test_no_marker_needed(self):
         """No marker needed - class is private."""
         pass
-''')
-        
-        # Run linter with only PL004
-        config = ProboscisConfig(rules={"PL004": {"enabled": True}})
-        linter = ProboscisLinter(config)
-        violations = linter.lint_project(root)
-        
-        # Should only find violations for public test functions
-        pl004_violations = [v for v in violations if v.rule_name.startswith("PL004")]
-        func_names = {v.function_name for v in pl004_violations}
-        expected = {'test_public_needs_marker', 'test_needs_marker'}
-        assert func_names == expected
-
+'''
 
-@pytest.mark.integration
-def test_cli_with_public_only_mode():
-    """CLI should respect public-only mode by default."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir)
-        
-        # Create source with private functions
-        src = root / "src"
-        src.mkdir()
-        module = src / "module.py"
-        module.write_text('''
+_PUBLIC_PRIVATE_SRC = b'''
 def public_func():
     """Public function."""
     return 1
@@ -204,35 +108,9 @@ def public_func():
 def _private_func():
     """Private function."""
     return 2
-''')
-        
-        # Create empty test directory
-        test_dir = root / "test" / "unit"
-        test_dir.mkdir(parents=True)
-        (test_dir / "test_empty.py").write_text("# Empty\n")
-        
-        # Run CLI
-        runner = CliRunner()
-        result = runner.invoke(cli, [str(root), "--format", "json"])
-        
-        # Parse output
-        output_data = json.loads(result.output)
-        violations = output_data["violations"]
-        
-        # Should only have violations for public_func
-        func_names = {v["function"] for v in violations}
-        assert func_names == {'public_func'}
-
+'''
 
-@pytest.mark.integration
-def test_strict_mode_configuration():
-    """Test strict mode includes private functions."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir)
-        
-        # Create config file with strict mode
-        config_file = root / "pyproject.toml"
-        config_file.write_text("""
+_STRICT_PYPROJECT = b"""
 [tool.proboscis]
 strict_mode = true
 
@@ -241,125 +119,25 @@ PL001 = true
 PL002 = false
 PL003 = false
 PL004 = false
-""")
-        
-        # Create source with private function
-        src = root / "src"
-        src.mkdir()
-        module = src / "module.py"
-        module.write_text('''
+"""
+
+_STRICT_SRC = b'''
 def public_func():
     return 1
 
 def _private_func():
     return 2
-''')
-        
-        # Create empty test directory
-        test_dir = root / "test" / "unit"
-        test_dir.mkdir(parents=True)
-        (test_dir / "test_empty.py").write_text("# Empty\n")
-        
-        # Run linter
-        linter = ProboscisLinter()
-        violations = linter.lint_project(root)
-        
-        # In strict mode, should find violations for both functions
-        func_names = {v.function_name for v in violations}
-        assert func_names == {'public_func', '_private_func'}
-
-
-@pytest.mark.integration
-def test_performance_with_large_codebase():
-    """Test performance doesn't degrade with public/private detection."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir)
-        
-        # Create many modules with mixed public/private functions
-        src = root / "src"
-        src.mkdir()
-        
-        for i in range(20):
-            module = src / f"module_{i}.py"
-            content = f'''
-__all__ = ['public_func_{i}']
-
-def public_func_{i}():
-    """Public function."""
-    return {i}
-
-def private_func_{i}():
-    """Private function - not in __all__."""
-    return {i * 2}
-
-def _underscore_func_{i}():
-    """Private function - underscore."""
-    return {i * 3}
-
-class PublicClass_{i}:
-    """Public class."""
-    def method(self):
-        return "public"
-    
-    def _private_method(self):
-        return "private"
-
-class _PrivateClass_{i}:
-    """Private class."""
-    def method(self):
-        return "private"
 '''
-            module.write_text(content)
-        
-        # Create test directories
-        for test_type in ["unit", "integration", "e2e"]:
-            test_dir = root / "test" / test_type
-            test_dir.mkdir(parents=True)
-            (test_dir / "test_empty.py").write_text("# Empty\n")
-        
-        # Time the linting
-        import time
-        start_time = time.time()
-        
-        linter = ProboscisLinter()
-        violations = linter.lint_project(root)
-        
-        end_time = time.time()
-        execution_time = end_time - start_time
-        
-        # Should complete quickly (under 5 seconds for 20 modules)
-        assert execution_time < 5
-        
-        # Should only find violations for public functions
-        # Each module has 1 public function and 1 public method
-        # Times 3 rules (PL001, PL002, PL003)
-        expected_count = 20 * 2 * 3  # 120 violations
-        assert len(violations) == expected_count
-
 
-@pytest.mark.integration
-def test_package_level_all():
-    """Test package-level __all__ in __init__.py."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir)
-        
-        # Create package structure
-        pkg = root / "my_package"
-        pkg.mkdir()
-        
-        # Create __init__.py with __all__
-        init = pkg / "__init__.py"
-        init.write_text('''
+_PKG_INIT_SRC = b'''
 """My package."""
 __all__ = ['api_function', 'ApiClass']
 
 from .module1 import api_function, internal_function
 from .module2 import ApiClass, InternalClass
-''')
-        
-        # Create module1
-        module1 = pkg / "module1.py"
-        module1.write_text('''
+'''
+
+_PKG_MODULE1_SRC = b'''
 def api_function():
     """This is part of the public API."""
     return "api"
@@ -367,16 +145,14 @@ def api_function():
 def internal_function():
     """This is internal."""
     return "internal"
-''')
-        
-        # Create module2
-        module2 = pkg / "module2.py"
-        module2.write_text('''
+'''
+
+_PKG_MODULE2_SRC = b'''
 class ApiClass:
     """This is part of the public API."""
     def public_method(self):
         return "public"
-    
+
     def _private_method(self):
         return "private"
 
@@ -384,19 +160,271 @@ class InternalClass:
     """This is internal."""
     def method(self):
         return "internal"
+'''
+
+# One module of the large-codebase test, substituted with I, I2 (= I*2) and I3 (= I*3)
+_LARGE_MODULE_TEMPLATE = Template('''
+__all__ = ['public_func_$I']
+
+def public_func_$I():
+    """Public function."""
+    return $I
+
+def private_func_$I():
+    """Private function - not in __all__."""
+    return $I2
+
+def _underscore_func_$I():
+    """Private function - underscore."""
+    return $I3
+
+class PublicClass_$I:
+    """Public class."""
+    def method(self):
+        return "public"
+
+    def _private_method(self):
+        return "private"
+
+class _PrivateClass_$I:
+    """Private class."""
+    def method(self):
+        return "private"
 ''')
-        
-        # Create test directories
-        for test_type in ["unit", "integration", "e2e"]:
-            test_dir = root / "test" / test_type
-            test_dir.mkdir(parents=True)
-            (test_dir / "test_empty.py").write_text("# Empty\n")
-        
-        # Run linter
-        linter = ProboscisLinter()
-        violations = linter.lint_project(root)
-        
-        # Should only find violations for api_function and ApiClass.public_method
-        func_names = {v.function_name for v in violations}
-        expected = {'api_function', 'public_method'}
-        assert func_names == expected
\ No newline at end of file
+
+# Function names each test expects violations for
+_EXPECTED_MODULE_ALL = frozenset({"public_func", "method"})  # Only PublicClass.method
+_EXPECTED_UNDERSCORE = frozenset({"public_func", "public_method"})
+_EXPECTED_PL004 = frozenset({"test_public_needs_marker", "test_needs_marker"})
+_EXPECTED_PUBLIC_ONLY = frozenset({"public_func"})
+_EXPECTED_STRICT = frozenset({"public_func", "_private_func"})
+_EXPECTED_PACKAGE_ALL = frozenset({"api_function", "public_method"})
+
+_EXPECTED_RULES = frozenset({"PL001", "PL002", "PL003"})
+
+
+@lru_cache(maxsize=32)
+def _config(rules: tuple) -> ProboscisConfig:
+    """Config for sorted (rule, enabled) pairs, shared across calls; do not mutate it."""
+    return ProboscisConfig(rules={rule: {"enabled": enabled} for rule, enabled in rules})
+
+
+def _cfg(**rules: bool) -> ProboscisConfig:
+    """Config enabling or disabling each given rule, via the shared _config cache."""
+    return _config(tuple(sorted(rules.items())))
+
+
+@pytest.fixture(scope="session")
+def _empty_test_skeleton(tmp_path_factory):
+    """Template tree with an empty test file in each test directory, built once."""
+    skeleton = tmp_path_factory.mktemp("skeleton")
+    for test_type in ["unit", "integration", "e2e"]:
+        test_dir = skeleton / "test" / test_type
+        test_dir.mkdir(parents=True)
+        (test_dir / "test_empty.py").write_bytes(_EMPTY_STUB)
+    return skeleton
+
+
+@pytest.fixture
+def project_root(_empty_test_skeleton, tmp_path):
+    """Fresh copy of the empty test skeleton for a single test.
+    
+    The tree is walked by the Rust extension, which reads the real filesystem,
+    so it has to live on disk rather than in an in-memory fake like pyfakefs.
+    """
+    root = tmp_path / "root"
+    shutil.copytree(_empty_test_skeleton, root, dirs_exist_ok=True)
+    return root
+
+
+@pytest.mark.integration
+def test_all_rules_respect_module_all(project_root):
+    """All rules (PL001-PL004) should respect __all__ in modules."""
+    root = project_root
+
+    # Create source module with __all__
+    src = root / "src"
+    src.mkdir()
+    module = src / "my_module.py"
+    module.write_bytes(_MODULE_ALL_SRC)
+
+    # Run linter with all rules enabled
+    config = _cfg(PL001=True, PL002=True, PL003=True, PL004=False)  # Disable PL004 for this test
+    linter = ProboscisLinter(config)
+    violations = linter.lint_project(root)
+
+    # Should only find violations for public_func and PublicClass.method
+    assert frozenset(v.function_name for v in violations) == _EXPECTED_MODULE_ALL
+
+    # Verify we have violations from all three rules
+    assert frozenset(v.rule_name.split(':')[0] for v in violations) == _EXPECTED_RULES
+
+
+@pytest.mark.integration
+def test_all_rules_respect_underscore_convention(project_root):
+    """All rules should respect underscore convention when no __all__."""
+    root = project_root
+
+    # Create source module without __all__
+    src = root / "src"
+    src.mkdir()
+    module = src / "my_module.py"
+    module.write_bytes(_UNDERSCORE_SRC)
+
+    # Run linter
+    config = _cfg(PL001=True, PL002=True, PL003=True, PL004=False)
+    linter = ProboscisLinter(config)
+    violations = linter.lint_project(root)
+
+    # Should only find violations for public_func and PublicClass.public_method
+    assert frozenset(v.function_name for v in violations) == _EXPECTED_UNDERSCORE
+
+
+@pytest.mark.integration
+def test_pl004_respects_public_api(project_root):
+    """PL004 should only check public test functions."""
+    root = project_root
+
+    # Create test file with mixed public/private functions
+    test_file = root / "test" / "unit" / "test_mixed.py"
+    test_file.write_bytes(_MIXED_TESTS_SRC)
+
+    # Run linter with only PL004
+    config = _cfg(PL004=True)
+    linter = ProboscisLinter(config)
+    violations = linter.lint_project(root)
+
+    # Should only find violations for public test functions
+    pl004_violations = [v for v in violations if v.rule_name.startswith("PL004")]
+    assert frozenset(v.function_name for v in pl004_violations) == _EXPECTED_PL004
+
+
+@pytest.mark.integration
+def test_cli_with_public_only_mode(project_root, json_gen):
+    """JSON output should respect public-only mode by default.
+    
+    Lints and serializes in-process; the Click wiring itself is covered by
+    test_integration_cli.py.
+    """
+    root = project_root
+
+    # Create source with private functions
+    src = root / "src"
+    src.mkdir()
+    module = src / "module.py"
+    module.write_bytes(_PUBLIC_PRIVATE_SRC)
+
+    # Lint with the default config and render the JSON report
+    output_data = json.loads(json_gen.generate_report(ProboscisLinter().lint_project(root)))
+    violations = output_data["violations"]
+
+    # Should only have violations for public_func
+    assert frozenset(v["function"] for v in violations) == _EXPECTED_PUBLIC_ONLY
+
+
+@pytest.mark.integration
+def test_strict_mode_configuration(project_root):
+    """Test strict mode includes private functions."""
+    root = project_root
+
+    # Create config file with strict mode
+    config_file = root / "pyproject.toml"
+    config_file.write_bytes(_STRICT_PYPROJECT)
+
+    # Create source with private function
+    src = root / "src"
+    src.mkdir()
+    module = src / "module.py"
+    module.write_bytes(_STRICT_SRC)
+
+    # Run linter
+    linter = ProboscisLinter()
+    violations = linter.lint_project(root)
+
+    # In strict mode, should find violations for both functions
+    assert frozenset(v.function_name for v in violations) == _EXPECTED_STRICT
+
+
+def _write_large_codebase(root: Path, write_tree) -> None:
+    """Create 20 modules with mixed public/private functions under root/src."""
+    src = root / "src"
+    src.mkdir()
+
+    bodies = [
+        _LARGE_MODULE_TEMPLATE.substitute(I=i, I2=i * 2, I3=i * 3).encode("ascii")
+        for i in range(20)
+    ]
+
+    def emit_module(i):
+        # One raw os.write per module
+        write_tree(src, {f"module_{i}.py": bodies[i]})
+
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        # Consume the iterator so write errors propagate
+        list(executor.map(emit_module, range(20)))
+
+
+# Each module has 1 public function and 1 public method,
+# times 3 rules (PL001, PL002, PL003)
+_LARGE_CODEBASE_VIOLATIONS = 20 * 2 * 3  # 120 violations
+
+
+@pytest.mark.integration
+def test_performance_with_large_codebase(project_root, write_tree):
+    """Test public/private detection stays correct on a larger codebase."""
+    root = project_root
+    _write_large_codebase(root, write_tree)
+
+    linter = ProboscisLinter()
+    violations = linter.lint_project(root)
+
+    # Should only find violations for public functions
+    assert len(violations) == _LARGE_CODEBASE_VIOLATIONS
+
+
+@pytest.mark.integration
+@pytest.mark.perf
+def test_performance_with_large_codebase_benchmark(project_root, write_tree, benchmark, request):
+    """Benchmark linting the larger codebase (requires pytest-benchmark).
+    
+    Run in a single process, e.g. `pytest -m perf -n 0`; under xdist
+    pytest-benchmark turns itself off and would time nothing.
+    """
+    if hasattr(request.config, "workerinput"):
+        pytest.skip("pytest-benchmark is disabled under xdist; run with -n 0")
+    root = project_root
+    _write_large_codebase(root, write_tree)
+
+    linter = ProboscisLinter()
+    violations = benchmark.pedantic(linter.lint_project, args=(root,), rounds=3, iterations=1)
+
+    assert len(violations) == _LARGE_CODEBASE_VIOLATIONS
+
+
+@pytest.mark.integration
+def test_package_level_all(project_root):
+    """Test package-level __all__ in __init__.py."""
+    root = project_root
+
+    # Create package structure
+    pkg = root / "my_package"
+    pkg.mkdir()
+
+    # Create __init__.py with __all__
+    init = pkg / "__init__.py"
+    init.write_bytes(_PKG_INIT_SRC)
+
+    # Create module1
+    module1 = pkg / "module1.py"
+    module1.write_bytes(_PKG_MODULE1_SRC)
+
+    # Create module2
+    module2 = pkg / "module2.py"
+    module2.write_bytes(_PKG_MODULE2_SRC)
+
+    # Run linter
+    linter = ProboscisLinter()
+    violations = linter.lint_project(root)
+
+    # Should only find violations for api_function and ApiClass.public_method
+    assert frozenset(v.function_name for v in violations) == _EXPECTED_PACKAGE_ALL
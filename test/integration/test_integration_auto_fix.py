@@ -1,11 +1,102 @@
 """Integration tests for auto-fix functionality."""
+import contextlib
+from io import StringIO
 import pytest
 from pathlib import Path
 from textwrap import dedent
-from click.testing import CliRunner
 from proboscis_linter.cli import cli
 
 
+# Fixture sources and expected fixes, dedented once at import time
+_SIMPLE_SRC = dedent('''
+    @pytest.mark.integration
+    def test_simple():
+        assert True
+    
+    @pytest.mark.integration
+    def test_another():
+        assert 1 + 1 == 2
+''').strip()
+
+_SIMPLE_EXPECTED = dedent('''
+    @pytest.mark.integration
+    @pytest.mark.unit
+    def test_simple():
+        assert True
+    
+    @pytest.mark.integration
+    @pytest.mark.unit
+    def test_another():
+        assert 1 + 1 == 2
+''').strip()
+
+_EXISTING_DECORATORS_SRC = dedent('''
+    import pytest
+    
+    @pytest.fixture
+    def setup():
+        return "data"
+    
+    @pytest.mark.integration
+    @pytest.mark.parametrize("value", [1, 2, 3])
+    def test_parametrized(value):
+        assert value > 0
+''').strip()
+
+_PL004_DISABLED_PYPROJECT = dedent('''
+    [tool.proboscis]
+    [tool.proboscis.rules]
+    PL004 = false
+''')
+
+_DISABLED_RULE_SRC = dedent('''
+    @pytest.mark.integration
+    def test_simple():
+        assert True
+''').strip()
+
+_VERBOSE_SRC = dedent('''
+    @pytest.mark.integration
+    def test_e2e_scenario():
+        pass
+''').strip()
+
+_CLASS_SRC = dedent('''
+    class TestMath:
+        @pytest.mark.integration
+        def test_addition(self):
+            assert 1 + 1 == 2
+        
+        @pytest.mark.integration
+        def test_subtraction(self):
+            assert 5 - 3 == 2
+''').strip()
+
+_CLASS_EXPECTED = dedent('''
+    class TestMath:
+        @pytest.mark.integration
+        @pytest.mark.unit
+        def test_addition(self):
+            assert 1 + 1 == 2
+        
+        @pytest.mark.integration
+        @pytest.mark.unit
+        def test_subtraction(self):
+            assert 5 - 3 == 2
+''').strip()
+
+
+def _run_cli(*args) -> tuple[int, str]:
+    """Run the CLI in-process and return its exit code and combined stdout/stderr."""
+    buf = StringIO()
+    with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+        try:
+            exit_code = cli.main([str(arg) for arg in args], standalone_mode=False) or 0
+        except SystemExit as e:
+            exit_code = e.code or 0
+    return exit_code, buf.getvalue()
+
+
 class TestAutoFixIntegration:
     """Integration tests for auto-fix feature."""
     
@@ -18,38 +109,18 @@ class TestAutoFixIntegration:
         
         # Create a test file without markers
         test_file = test_dir / "test_example.py"
-        test_file.write_text(dedent('''
-            @pytest.mark.integration
-            def test_simple():
-                assert True
-            
-            @pytest.mark.integration
-            def test_another():
-                assert 1 + 1 == 2
-        ''').strip())
+        test_file.write_text(_SIMPLE_SRC)
         
         # Run linter with --fix flag
-        runner = CliRunner()
-        result = runner.invoke(cli, [str(tmp_path), "--fix"])
+        exit_code, output = _run_cli(tmp_path, "--fix")
         
         # Check the fixes were applied
-        assert result.exit_code == 0
+        assert exit_code == 0
         # After fixes are applied, there should be no violations
-        assert "No violations found" in result.output
+        assert "No violations found" in output
         
         # Check the file content was updated
-        expected = dedent('''
-            @pytest.mark.integration
-            @pytest.mark.unit
-            def test_simple():
-                assert True
-            
-            @pytest.mark.integration
-            @pytest.mark.unit
-            def test_another():
-                assert 1 + 1 == 2
-        ''').strip()
-        assert test_file.read_text() == expected
+        assert test_file.read_text() == _SIMPLE_EXPECTED
     
     @pytest.mark.integration
     def test_fix_with_existing_decorators(self, tmp_path):
@@ -60,25 +131,13 @@ class TestAutoFixIntegration:
         
         # Create a test file with existing decorator
         test_file = test_dir / "test_example.py"
-        test_file.write_text(dedent('''
-            import pytest
-            
-            @pytest.fixture
-            def setup():
-                return "data"
-            
-            @pytest.mark.integration
-            @pytest.mark.parametrize("value", [1, 2, 3])
-            def test_parametrized(value):
-                assert value > 0
-        ''').strip())
+        test_file.write_text(_EXISTING_DECORATORS_SRC)
         
         # Run linter with --fix flag
-        runner = CliRunner()
-        result = runner.invoke(cli, [str(tmp_path), "--fix"])
+        exit_code, output = _run_cli(tmp_path, "--fix")
         
         # Check the fixes were applied
-        assert result.exit_code == 0
+        assert exit_code == 0
         
         # Check the file content was updated correctly
         content = test_file.read_text()
@@ -95,31 +154,22 @@ class TestAutoFixIntegration:
         
         # Create a config file that disables PL004
         config_file = tmp_path / "pyproject.toml"
-        config_file.write_text(dedent('''
-            [tool.proboscis]
-            [tool.proboscis.rules]
-            PL004 = false
-        '''))
+        config_file.write_text(_PL004_DISABLED_PYPROJECT)
         
         # Create a test file without markers
         test_file = test_dir / "test_example.py"
-        original_content = dedent('''
-            @pytest.mark.integration
-            def test_simple():
-                assert True
-        ''').strip()
-        test_file.write_text(original_content)
+        original_content = _DISABLED_RULE_SRC.encode()
+        test_file.write_bytes(original_content)
         
         # Run linter with --fix flag
-        runner = CliRunner()
-        result = runner.invoke(cli, [str(tmp_path), "--fix"])
+        exit_code, output = _run_cli(tmp_path, "--fix")
         
         # Check no fixes were applied (rule is disabled)
-        assert result.exit_code == 0
-        assert "Applying automatic fixes" not in result.output
+        assert exit_code == 0
+        assert "Applying automatic fixes" not in output
         
         # Check the file content is unchanged
-        assert test_file.read_text() == original_content
+        assert test_file.read_bytes() == original_content
     
     @pytest.mark.integration
     def test_fix_with_verbose_output(self, tmp_path):
@@ -130,21 +180,16 @@ class TestAutoFixIntegration:
         
         # Create a test file without markers
         test_file = test_dir / "test_example.py"
-        test_file.write_text(dedent('''
-            @pytest.mark.integration
-            def test_e2e_scenario():
-                pass
-        ''').strip())
+        test_file.write_text(_VERBOSE_SRC)
         
         # Run linter with --fix and --verbose flags
-        runner = CliRunner()
-        result = runner.invoke(cli, [str(tmp_path), "--fix", "--verbose"])
+        exit_code, output = _run_cli(tmp_path, "--fix", "--verbose")
         
         # Check verbose output
-        assert result.exit_code == 0
-        assert "Applying automatic fixes" in result.output
-        assert "Applied 1 fixes to" in result.output
-        assert "Re-linting after applying fixes" in result.output
+        assert exit_code == 0
+        assert "Applying automatic fixes" in output
+        assert "Applied 1 fixes to" in output
+        assert "Re-linting after applying fixes" in output
         
         # Check the fix was applied
         content = test_file.read_text()
@@ -159,35 +204,13 @@ class TestAutoFixIntegration:
         
         # Create a test file with class methods
         test_file = test_dir / "test_class.py"
-        test_file.write_text(dedent('''
-            class TestMath:
-                @pytest.mark.integration
-                def test_addition(self):
-                    assert 1 + 1 == 2
-                
-                @pytest.mark.integration
-                def test_subtraction(self):
-                    assert 5 - 3 == 2
-        ''').strip())
+        test_file.write_text(_CLASS_SRC)
         
         # Run linter with --fix flag
-        runner = CliRunner()
-        result = runner.invoke(cli, [str(tmp_path), "--fix"])
+        exit_code, output = _run_cli(tmp_path, "--fix")
         
         # Check the fixes were applied
-        assert result.exit_code == 0
+        assert exit_code == 0
         
         # Check indentation is preserved
-        expected = dedent('''
-            class TestMath:
-                @pytest.mark.integration
-                @pytest.mark.unit
-                def test_addition(self):
-                    assert 1 + 1 == 2
-                
-                @pytest.mark.integration
-                @pytest.mark.unit
-                def test_subtraction(self):
-                    assert 5 - 3 == 2
-        ''').strip()
-        assert test_file.read_text() == expected
\ No newline at end of file
+        assert test_file.read_text() == _CLASS_EXPECTED
\ No newline at end of file
@@ -1,22 +1,33 @@
 """Integration tests for the benchmark module."""
+import re
 import sys
-import tempfile
 from pathlib import Path
-from unittest.mock import patch, Mock
+from unittest.mock import Mock
 
 import pytest
 
 from proboscis_linter.config import ProboscisConfig
 from proboscis_linter.models import LintViolation
 
-
-# Import the module under test
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Module under test, importable via the pytest pythonpath setting
 import benchmark
 
 
+# The project fixtures are module-scoped, so keep these tests on one xdist worker
+pytestmark = pytest.mark.xdist_group("benchmark")
+
+_RUST_SPEEDUP_RE = re.compile(r'Rust is (\d+\.\d+)x faster')
+
+# Shared stand-in violation; the mocked linters only report how many they found
+_VIOLATION = Mock(spec=LintViolation)
+_TEN_VIOLATIONS = [_VIOLATION] * 10
+
+# Fake project path; the mocked linter never touches it
+_PROJECT_PATH = Path("/test/project")
+
+
 @pytest.mark.integration
-def test_benchmark_implementation():
+def test_benchmark_implementation(captured_print):
     """Integration test for the benchmark_implementation function."""
     # Arrange
     mock_linter = Mock()
@@ -31,37 +42,36 @@ def test_benchmark_implementation():
         )
     ]
     mock_linter.lint_project.return_value = violations
-    project_path = Path("/test/project")
+    project_path = _PROJECT_PATH
 
     # Act
-    with patch('builtins.print'):
-        duration, violation_count = benchmark.benchmark_implementation(
-            mock_linter, project_path, "Integration"
-        )
+    duration, violation_count = benchmark.benchmark_implementation(
+        mock_linter, project_path, "Integration"
+    )
 
     # Assert
     assert isinstance(duration, float)
     assert duration > 0
     assert violation_count == 1
-    mock_linter.lint_project.assert_called_once_with(project_path)
+    assert mock_linter.lint_project.call_count == 1
+    assert mock_linter.lint_project.call_args.args[0] is _PROJECT_PATH
 
 
 class TestBenchmarkImplementation:
     """Integration tests for benchmark_implementation function."""
 
-    @pytest.fixture
-    def temp_project(self):
-        """Create a temporary project directory with test files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            
-            # Create test directory structure
-            test_dir = project_path / "test"
-            test_dir.mkdir()
-            
-            # Create a test file with violations
-            test_file = test_dir / "test_example.py"
-            test_file.write_text("""
+    @pytest.fixture(scope="module")
+    def temp_project(self, tmp_path_factory):
+        """Create a temporary project directory with test files, shared read-only."""
+        project_path = tmp_path_factory.mktemp("proj")
+        
+        # Create test directory structure
+        test_dir = project_path / "test"
+        test_dir.mkdir()
+        
+        # Create a test file with violations
+        test_file = test_dir / "test_example.py"
+        test_file.write_text("""
 import pytest
 
 @pytest.mark.integration
@@ -73,10 +83,10 @@ def test_missing_implementation():
 def test_another_missing():
     pass
 """)
-            
-            # Create another test file
-            test_file2 = test_dir / "test_another.py"
-            test_file2.write_text("""
+        
+        # Create another test file
+        test_file2 = test_dir / "test_another.py"
+        test_file2.write_text("""
 @pytest.mark.integration
 def test_valid():
     assert True
@@ -85,14 +95,14 @@ def test_valid():
 def test_also_valid():
     assert 1 + 1 == 2
 """)
-            
-            yield project_path
+        
+        return project_path
 
     @pytest.mark.integration
-    def test_benchmark_implementation_with_real_config(self, temp_project):
+    def test_benchmark_implementation_with_real_config(self, temp_project, default_config, captured_print):
         """Test benchmarking with real configuration object."""
         # Arrange
-        ProboscisConfig()  # Ensure it can be created
+        assert isinstance(default_config, ProboscisConfig)  # Ensure it can be created
         mock_linter = Mock()
         
         # Simulate realistic violations
@@ -117,76 +127,62 @@ def test_also_valid():
         mock_linter.lint_project.return_value = violations
         
         # Act
-        with patch('builtins.print') as mock_print:
-            duration, violation_count = benchmark.benchmark_implementation(
-                mock_linter, temp_project, "Integration Test"
-            )
+        duration, violation_count = benchmark.benchmark_implementation(
+            mock_linter, temp_project, "Integration Test"
+        )
         
         # Assert
         assert duration > 0
         assert violation_count == 2
-        mock_linter.lint_project.assert_called_once_with(temp_project)
+        assert mock_linter.lint_project.call_count == 1
+        assert mock_linter.lint_project.call_args.args[0] is temp_project
         
         # Verify output format
-        output_calls = [str(call) for call in mock_print.call_args_list]
-        assert any("Integration Test Implementation:" in call for call in output_calls)
-        assert any("Violations found: 2" in call for call in output_calls)
+        joined = "\n".join(captured_print)
+        assert "Integration Test Implementation:" in joined
+        assert "Violations found: 2" in joined
 
     @pytest.mark.integration
-    def test_benchmark_implementation_performance_measurement(self, temp_project):
+    def test_benchmark_implementation_performance_measurement(self, temp_project, fake_clock, monkeypatch, captured_print):
         """Test that performance is measured accurately for different execution times."""
         # Arrange
-        import time
+        monkeypatch.setattr(benchmark, 'time', fake_clock)
         
         # Create two mock linters with different execution times
         fast_linter = Mock()
         slow_linter = Mock()
-        
-        def fast_lint(path):
-            time.sleep(0.01)  # 10ms
-            return []
-        
-        def slow_lint(path):
-            time.sleep(0.1)  # 100ms
-            return []
-        
-        fast_linter.lint_project.side_effect = fast_lint
-        slow_linter.lint_project.side_effect = slow_lint
+        fast_linter.lint_project.side_effect = fake_clock.timed_lint(0.01, [])  # 10ms
+        slow_linter.lint_project.side_effect = fake_clock.timed_lint(0.1, [])  # 100ms
         
         # Act
-        with patch('builtins.print'):
-            fast_duration, _ = benchmark.benchmark_implementation(
-                fast_linter, temp_project, "Fast"
-            )
-            slow_duration, _ = benchmark.benchmark_implementation(
-                slow_linter, temp_project, "Slow"
-            )
+        fast_duration, _ = benchmark.benchmark_implementation(
+            fast_linter, temp_project, "Fast"
+        )
+        slow_duration, _ = benchmark.benchmark_implementation(
+            slow_linter, temp_project, "Slow"
+        )
         
         # Assert
-        assert fast_duration < slow_duration
-        assert fast_duration >= 0.01
-        assert slow_duration >= 0.1
-        # Allow some overhead
-        assert fast_duration < 0.05
-        assert slow_duration < 0.15
+        # The fake clock only advances inside the linters, so durations are exact
+        assert fast_duration == pytest.approx(0.01)
+        assert slow_duration == pytest.approx(0.1)
 
 
 class TestMain:
     """Integration tests for main function."""
 
-    @pytest.fixture
-    def temp_project_with_config(self):
-        """Create a temporary project with configuration file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            
-            # Create test directory
-            test_dir = project_path / "test"
-            test_dir.mkdir()
-            
-            # Create configuration file
-            config_file = project_path / "pyproject.toml"
-            config_file.write_text("""
+    @pytest.fixture(scope="module")
+    def temp_project_with_config(self, tmp_path_factory):
+        """Create a temporary project with configuration file, shared read-only."""
+        project_path = tmp_path_factory.mktemp("proj_with_config")
+        
+        # Create test directory
+        test_dir = project_path / "test"
+        test_dir.mkdir()
+        
+        # Create configuration file
+        config_file = project_path / "pyproject.toml"
+        config_file.write_text("""
 [tool.proboscis]
 test_directories = ["test", "tests"]
 test_patterns = ["test_*.py", "*_test.py"]
@@ -195,10 +191,10 @@ exclude_patterns = ["**/conftest.py"]
 [tool.proboscis.rules.PROB001]
 enabled = true
 """)
-            
-            # Create test files
-            test_file = test_dir / "test_sample.py"
-            test_file.write_text("""
+        
+        # Create test files
+        test_file = test_dir / "test_sample.py"
+        test_file.write_text("""
 @pytest.mark.integration
 def test_empty():
     pass
@@ -207,133 +203,119 @@ def test_empty():
 def test_with_implementation():
     assert True
 """)
-            
-            yield project_path
+        
+        return project_path
 
     @pytest.mark.integration
-    @patch('benchmark.RustLinterWrapper')
-    def test_main_integration_with_config_loading(self, mock_rust_wrapper, temp_project_with_config):
+    def test_main_integration_with_config_loading(self, temp_project_with_config, rust_wrapper_spec,
+                                                  monkeypatch, captured_print):
         """Test main function with configuration loading from project."""
         # Arrange
-        mock_rust_wrapper.return_value = Mock()
+        # Mock the Python linter too; only the benchmark flow is under test
+        mock_python_linter = Mock()
+        mock_python_linter.return_value.lint_project.return_value = []
+        monkeypatch.setattr(benchmark, 'ProboscisLinter', mock_python_linter)
+        
+        mock_rust_wrapper = Mock(return_value=Mock(spec=rust_wrapper_spec))
+        monkeypatch.setattr(benchmark, 'RustLinterWrapper', mock_rust_wrapper)
         
         # Mock the lint_project method to return some violations
-        mock_rust_wrapper.return_value.lint_project.return_value = [
-            Mock(spec=LintViolation) for _ in range(3)
-        ]
+        mock_rust_wrapper.return_value.lint_project.return_value = [_VIOLATION] * 3
+        
+        monkeypatch.setattr(sys, 'argv', ['benchmark.py', str(temp_project_with_config)])
+        
+        # Act
+        benchmark.main()
+        
+        # Assert
+        # Verify configuration was loaded
+        assert mock_python_linter.called
+        assert mock_rust_wrapper.called
         
-        with patch.object(sys, 'argv', ['benchmark.py', str(temp_project_with_config)]):
-            with patch('builtins.print') as mock_print:
-                
-                # Act
-                benchmark.main()
-                
-                # Assert
-                # Verify configuration was loaded
-                assert mock_rust_wrapper.called
-                
-                # Verify benchmark was run
-                output = [str(call) for call in mock_print.call_args_list]
-                assert any(f"Benchmarking linter on: {temp_project_with_config}" in call for call in output)
-                assert any("Python Implementation:" in call for call in output)
-                assert any("Rust Implementation:" in call for call in output)
-                assert any("Performance Comparison:" in call for call in output)
+        # Verify benchmark was run
+        joined = "\n".join(captured_print)
+        assert f"Benchmarking linter on: {temp_project_with_config}" in joined
+        assert "Python Implementation:" in joined
+        assert "Rust Implementation:" in joined
+        assert "Performance Comparison:" in joined
 
     @pytest.mark.integration
-    @patch('benchmark.ProboscisLinter')
-    @patch('benchmark.RustLinterWrapper')
-    def test_main_integration_with_different_implementations(self, mock_rust_wrapper, 
-                                                           mock_python_linter, temp_project_with_config):
+    def test_main_integration_with_different_implementations(self, temp_project_with_config,
+                                                           rust_wrapper_spec, monkeypatch, fake_clock, captured_print):
         """Test main comparing different implementation results."""
         # Arrange
+        monkeypatch.setattr(benchmark, 'time', fake_clock)
+        
         # Mock Python linter to be slower
         python_instance = Mock()
-        mock_python_linter.return_value = python_instance
+        monkeypatch.setattr(benchmark, 'ProboscisLinter', Mock(return_value=python_instance))
+        python_instance.lint_project.side_effect = fake_clock.timed_lint(0.05, _TEN_VIOLATIONS)  # 50ms
         
-        def slow_python_lint(path):
-            import time
-            time.sleep(0.05)  # 50ms
-            return [Mock(spec=LintViolation) for _ in range(10)]
+        # Mock Rust linter to be faster
+        rust_instance = Mock(spec=rust_wrapper_spec)
+        monkeypatch.setattr(benchmark, 'RustLinterWrapper', Mock(return_value=rust_instance))
+        rust_instance.lint_project.side_effect = fake_clock.timed_lint(0.01, _TEN_VIOLATIONS)  # 10ms
         
-        python_instance.lint_project.side_effect = slow_python_lint
+        monkeypatch.setattr(sys, 'argv', ['benchmark.py', str(temp_project_with_config)])
         
-        # Mock Rust linter to be faster
-        rust_instance = Mock()
-        mock_rust_wrapper.return_value = rust_instance
-        
-        def fast_rust_lint(path):
-            import time
-            time.sleep(0.01)  # 10ms
-            return [Mock(spec=LintViolation) for _ in range(10)]
-        
-        rust_instance.lint_project.side_effect = fast_rust_lint
-        
-        with patch.object(sys, 'argv', ['benchmark.py', str(temp_project_with_config)]):
-            with patch('builtins.print') as mock_print:
-                
-                # Act
-                benchmark.main()
-                
-                # Assert
-                output = [str(call) for call in mock_print.call_args_list]
-                
-                # Should show Rust is faster
-                speedup_line = next((call for call in output if "Rust is" in call and "faster" in call), None)
-                assert speedup_line is not None
-                
-                # Extract speedup value
-                import re
-                match = re.search(r'Rust is (\d+\.\d+)x faster', speedup_line)
-                assert match is not None
-                speedup = float(match.group(1))
-                
-                # Rust should be at least 2x faster given our timing
-                assert speedup >= 2.0
+        # Act
+        benchmark.main()
+        
+        # Assert
+        # Should show Rust is faster
+        speedups = [float(m.group(1)) for call in captured_print if (m := _RUST_SPEEDUP_RE.search(call))]
+        
+        # 50ms against 10ms on the fake clock is exactly a 5x speedup
+        assert speedups == [pytest.approx(5.0)]
 
     @pytest.mark.integration
-    @patch('benchmark.RustLinterWrapper')
-    def test_main_integration_error_handling(self, mock_rust_wrapper, temp_project_with_config):
+    def test_main_integration_error_handling(self, temp_project_with_config, monkeypatch, captured_print):
         """Test main function handles errors during benchmarking gracefully."""
         # Arrange
+        mock_python_linter = Mock()
+        mock_python_linter.return_value.lint_project.return_value = []
+        monkeypatch.setattr(benchmark, 'ProboscisLinter', mock_python_linter)
+        
         # Make Rust wrapper raise ImportError
-        mock_rust_wrapper.side_effect = ImportError("maturin not installed")
-        
-        with patch.object(sys, 'argv', ['benchmark.py', str(temp_project_with_config)]):
-            with patch('builtins.print') as mock_print:
-                
-                # Act (should not raise exception)
-                benchmark.main()
-                
-                # Assert
-                output = [str(call) for call in mock_print.call_args_list]
-                
-                # Should show Python results
-                assert any("Python Implementation:" in call for call in output)
-                
-                # Should show Rust error message
-                assert any("Rust implementation not available" in call for call in output)
-                assert any("maturin" in call for call in output)
+        monkeypatch.setattr(benchmark, 'RustLinterWrapper', Mock(side_effect=ImportError("maturin not installed")))
+        
+        monkeypatch.setattr(sys, 'argv', ['benchmark.py', str(temp_project_with_config)])
+        
+        # Act (should not raise exception)
+        benchmark.main()
+        
+        # Assert
+        # Should show Python results
+        joined = "\n".join(captured_print)
+        assert "Python Implementation:" in joined
+        
+        # Should show Rust error message
+        assert "Rust implementation not available" in joined
+        assert "maturin" in joined
 
     @pytest.mark.integration
-    def test_main_integration_with_empty_project(self):
+    def test_main_integration_with_empty_project(self, rust_wrapper_spec, monkeypatch, tmp_path,
+                                                 captured_print):
         """Test benchmarking an empty project."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            empty_project = Path(tmpdir)
-            
-            with patch.object(sys, 'argv', ['benchmark.py', str(empty_project)]):
-                with patch('builtins.print') as mock_print:
-                    with patch('benchmark.RustLinterWrapper'):
-                        
-                        # Act
-                        benchmark.main()
-                        
-                        # Assert
-                        output = [str(call) for call in mock_print.call_args_list]
-                        
-                        # Should complete without errors
-                        assert any("Python Implementation:" in call for call in output)
-                        assert any("Violations found: 0" in call for call in output)
-
+        empty_project = tmp_path
+        
+        monkeypatch.setattr(sys, 'argv', ['benchmark.py', str(empty_project)])
+        # Both linters find nothing in an empty project
+        mock_python_linter = Mock()
+        mock_python_linter.return_value.lint_project.return_value = []
+        monkeypatch.setattr(benchmark, 'ProboscisLinter', mock_python_linter)
+        rust_instance = Mock(spec=rust_wrapper_spec)
+        rust_instance.lint_project.return_value = []
+        monkeypatch.setattr(benchmark, 'RustLinterWrapper', Mock(return_value=rust_instance))
+        
+        # Act
+        benchmark.main()
+        
+        # Assert
+        # Should complete without errors
+        joined = "\n".join(captured_print)
+        assert "Python Implementation:" in joined
+        assert "Violations found: 0" in joined
 
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -1,31 +1,20 @@
 """Integration tests for proboscis_stop_hook.py."""
+import importlib.util
+import io
 import json
 import sys
 import subprocess
 import tempfile
 from pathlib import Path
 
-# Add the parent directory to the path to import proboscis_stop_hook
-sys.path.insert(0, '/Users/s22625/repos/proboscis-linter')
+import pytest
 
+# Hook script source, read once from the repository root
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_HOOK_SRC = (_REPO_ROOT / "proboscis_stop_hook.py").read_bytes()
 
-@pytest.mark.integration
-def test_main():
-    """Test the main function integration with actual subprocess calls."""
-    # Create a temporary directory structure for testing
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-        
-        # Create a simple Python project structure
-        src_dir = tmppath / "src"
-        src_dir.mkdir()
-        
-        test_dir = tmppath / "test"
-        test_dir.mkdir()
-        
-        # Create a simple Python file
-        example_py = src_dir / "example.py"
-        example_py.write_text("""
+# Sample project sources, pre-encoded so the test writes raw bytes
+_EXAMPLE_SRC = b"""
 def add(a, b):
     return a + b
 
@@ -39,11 +28,9 @@ def divide(a, b):
     if b == 0:
         raise ValueError("Cannot divide by zero")
     return a / b
-""")
-        
-        # Create a test file with good coverage
-        test_file = test_dir / "test_example.py"
-        test_file.write_text("""
+"""
+
+_TEST_EXAMPLE_SRC = b"""
 import sys
 sys.path.insert(0, '../src')
 from example import add, subtract, multiply, divide
@@ -70,34 +57,77 @@ def test_divide():
     assert divide(7, 2) == 3.5
     with pytest.raises(ValueError):
         divide(5, 0)
-""")
-        
-        # Create pyproject.toml
-        pyproject = tmppath / "pyproject.toml"
-        pyproject.write_text("""
+"""
+
+_PYPROJECT_SRC = b"""
 [project]
 name = "test-project"
 version = "0.1.0"
 dependencies = ["pytest", "pytest-cov"]
-""")
+"""
+
+_FAILING_TEST_SRC = b"""
+@pytest.mark.integration
+def test_will_fail():
+    assert False, "This test is designed to fail"
+"""
+
+
+def _load_hook(hook_script: Path):
+    """Import a copy of the hook script as a module, once per test."""
+    spec = importlib.util.spec_from_file_location("_proboscis_stop_hook_copy", hook_script)
+    hook = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(hook)
+    return hook
+
+
+def _run_hook(hook, stdin: str, monkeypatch, capsys) -> str:
+    """Call hook.main() in-process with the given stdin and return what it printed."""
+    monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+    try:
+        hook.main()
+    except SystemExit as e:
+        assert e.code in (0, None)
+    return capsys.readouterr().out
+
+
+@pytest.mark.integration
+def test_main(monkeypatch, capsys):
+    """Test the main function integration, in-process and via a real subprocess."""
+    # Create a temporary directory structure for testing
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        
+        # Create a simple Python project structure
+        src_dir = tmppath / "src"
+        src_dir.mkdir()
+        
+        test_dir = tmppath / "test"
+        test_dir.mkdir()
+        
+        # Create a simple Python file
+        example_py = src_dir / "example.py"
+        example_py.write_bytes(_EXAMPLE_SRC)
+        
+        # Create a test file with good coverage
+        test_file = test_dir / "test_example.py"
+        test_file.write_bytes(_TEST_EXAMPLE_SRC)
+        
+        # Create pyproject.toml
+        pyproject = tmppath / "pyproject.toml"
+        pyproject.write_bytes(_PYPROJECT_SRC)
         
         # Copy the proboscis_stop_hook.py to temp directory
         hook_script = tmppath / "proboscis_stop_hook.py"
-        original_hook = Path('/Users/s22625/repos/proboscis-linter/proboscis_stop_hook.py')
-        hook_script.write_text(original_hook.read_text())
+        hook_script.write_bytes(_HOOK_SRC)
+        hook = _load_hook(hook_script)
         
         # Test the hook script directly
         # Test case 1: Run with good coverage (should approve)
-        result = subprocess.run(
-            [sys.executable, str(hook_script)],
-            input='{}',
-            capture_output=True,
-            text=True,
-            cwd=str(tmppath)
-        )
+        stdout = _run_hook(hook, '{}', monkeypatch, capsys)
         
         # Parse the output
-        output = json.loads(result.stdout)
+        output = json.loads(stdout)
         
         # Since we're running in a test environment, it might fail due to missing dependencies
         # But we can verify the structure of the output
@@ -105,37 +135,27 @@ dependencies = ["pytest", "pytest-cov"]
         assert 'reason' in output
         
         # Test case 2: Run with stop_hook_active flag (should exit immediately)
+        # This one needs a real process to observe the exit code
         result = subprocess.run(
             [sys.executable, str(hook_script)],
-            input='{"stop_hook_active": true}',
+            input=b'{"stop_hook_active": true}',
             capture_output=True,
-            text=True,
             cwd=str(tmppath)
         )
         
         # Should exit with code 0 and no output
         assert result.returncode == 0
-        assert result.stdout == ''
+        assert result.stdout == b''
         
         # Test case 3: Test with failing tests
         # Create a test file that will fail
         failing_test = test_dir / "test_failing.py"
-        failing_test.write_text("""
-@pytest.mark.integration
-def test_will_fail():
-    assert False, "This test is designed to fail"
-""")
+        failing_test.write_bytes(_FAILING_TEST_SRC)
         
-        result = subprocess.run(
-            [sys.executable, str(hook_script)],
-            input='{}',
-            capture_output=True,
-            text=True,
-            cwd=str(tmppath)
-        )
+        stdout = _run_hook(hook, '{}', monkeypatch, capsys)
         
-        if result.stdout:
-            output = json.loads(result.stdout)
+        if stdout:
+            output = json.loads(stdout)
             # If tests were actually run, check the output
             if output['decision'] == 'block':
                 assert 'reason' in output
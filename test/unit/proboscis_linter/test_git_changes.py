@@ -1,206 +1,159 @@
 """Unit tests for git changed files functionality."""
+import shutil
 import subprocess
-import tempfile
-from pathlib import Path
 import pytest
 from proboscis_linter.linter import ProboscisLinter
 from proboscis_linter.config import ProboscisConfig
 
 
-def init_git_repo(path: Path):
-    """Initialize a git repository in the given path."""
-    subprocess.run(["git", "init"], cwd=path, check=True, capture_output=True)
-    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=path, check=True, capture_output=True)
-    subprocess.run(["git", "config", "user.name", "Test User"], cwd=path, check=True, capture_output=True)
+# Setup commands only need to succeed; nothing reads their output
+_QUIET = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+
+# Sources committed once on top of the template repository; each test changes some of them
+_COMMITTED_SOURCES = {
+    "src/module.py": b"def existing_function():\n    return 1\n",
+    "src/module1.py": b"def func1():\n    return 1\n",
+    "src/module2.py": b"def func2():\n    return 2\n",
+    "src/existing.py": b"def existing():\n    return 1\n",
+}
+
+
+@pytest.fixture(scope="module")
+def _sources_repo_template(git_repo_template, tmp_path_factory, write_tree):
+    """Template repository with _COMMITTED_SOURCES committed, built once."""
+    repo = tmp_path_factory.mktemp("git_changes") / "repo"
+    shutil.copytree(git_repo_template, repo)
+    write_tree(repo, _COMMITTED_SOURCES)
+    subprocess.run(["git", "add", "."], cwd=repo, check=True, **_QUIET)
+    subprocess.run(["git", "commit", "-m", "Add sources"], cwd=repo, check=True, **_QUIET)
+    return repo
+
+
+@pytest.fixture
+def sources_repo(_sources_repo_template, tmp_path):
+    """Private copy of the committed-sources repository for a single test."""
+    repo = tmp_path / "repo"
+    shutil.copytree(_sources_repo_template, repo)
+    return repo
 
 
 @pytest.mark.unit
-def test_lint_changed_files_no_git_repo():
+def test_lint_changed_files_no_git_repo(tmp_path):
     """Test that lint_changed_files returns empty violations when not in a git repo."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        # Create a source file
-        src_dir = tmpdir_path / "src"
-        src_dir.mkdir()
-        
-        source_file = src_dir / "module.py"
-        source_file.write_text(
-            "def my_function():\n"
-            "    return 42\n"
-        )
-        
-        # Create linter
-        config = ProboscisConfig()
-        linter = ProboscisLinter(config)
-        
-        # Should return empty violations when not in git repo
-        violations = linter.lint_changed_files(tmpdir_path)
-        assert len(violations) == 0
+    # Create a source file
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    
+    source_file = src_dir / "module.py"
+    source_file.write_text(
+        "def my_function():\n"
+        "    return 42\n"
+    )
+    
+    # Create linter
+    config = ProboscisConfig()
+    linter = ProboscisLinter(config)
+    
+    # Should return empty violations when not in git repo
+    violations = linter.lint_changed_files(tmp_path)
+    assert len(violations) == 0
 
 
 @pytest.mark.unit
-def test_lint_changed_files_unstaged():
+def test_lint_changed_files_unstaged(sources_repo):
     """Test linting files with unstaged changes."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        # Initialize git repo
-        init_git_repo(tmpdir_path)
-        
-        # Create a source file and commit it
-        src_dir = tmpdir_path / "src"
-        src_dir.mkdir()
-        
-        source_file = src_dir / "module.py"
-        source_file.write_text(
-            "def existing_function():\n"
-            "    return 1\n"
-        )
-        
-        subprocess.run(["git", "add", "."], cwd=tmpdir_path, check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=tmpdir_path, check=True, capture_output=True)
-        
-        # Modify the file (unstaged change)
-        source_file.write_text(
-            "def existing_function():\n"
-            "    return 1\n"
-            "\n"
-            "def new_function():\n"
-            "    return 42\n"
-        )
-        
-        # Create linter
-        config = ProboscisConfig()
-        linter = ProboscisLinter(config)
-        
-        # Lint only changed files
-        violations = linter.lint_changed_files(tmpdir_path)
-        
-        # Should find violations for new_function
-        assert any(v.function_name == "new_function" for v in violations)
-        # Might also have violations for existing_function since the whole file is considered changed
+    # src/module.py is already committed
+    source_file = sources_repo / "src" / "module.py"
+    
+    # Modify the file (unstaged change)
+    source_file.write_text(
+        "def existing_function():\n"
+        "    return 1\n"
+        "\n"
+        "def new_function():\n"
+        "    return 42\n"
+    )
+    
+    # Create linter
+    config = ProboscisConfig()
+    linter = ProboscisLinter(config)
+    
+    # Lint only changed files
+    violations = linter.lint_changed_files(sources_repo)
+    names = {v.function_name for v in violations}
+    
+    # Should find violations for new_function
+    assert "new_function" in names
+    # Might also have violations for existing_function since the whole file is considered changed
 
 
 @pytest.mark.unit
-def test_lint_changed_files_staged():
+def test_lint_changed_files_staged(sources_repo):
     """Test linting files with staged changes."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        # Initialize git repo
-        init_git_repo(tmpdir_path)
-        
-        # Create initial files and commit
-        src_dir = tmpdir_path / "src"
-        src_dir.mkdir()
-        
-        file1 = src_dir / "module1.py"
-        file1.write_text(
-            "def func1():\n"
-            "    return 1\n"
-        )
-        
-        file2 = src_dir / "module2.py"
-        file2.write_text(
-            "def func2():\n"
-            "    return 2\n"
-        )
-        
-        subprocess.run(["git", "add", "."], cwd=tmpdir_path, check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=tmpdir_path, check=True, capture_output=True)
-        
-        # Modify file1 and stage it
-        file1.write_text(
-            "def func1():\n"
-            "    return 1\n"
-            "\n"
-            "def func1_new():\n"
-            "    return 11\n"
-        )
-        subprocess.run(["git", "add", str(file1)], cwd=tmpdir_path, check=True, capture_output=True)
-        
-        # Create linter
-        config = ProboscisConfig()
-        linter = ProboscisLinter(config)
-        
-        # Lint only changed files
-        violations = linter.lint_changed_files(tmpdir_path)
-        
-        # Should only check file1, not file2
-        assert all(str(file1) in str(v.file_path) for v in violations)
-        assert not any(str(file2) in str(v.file_path) for v in violations)
+    # src/module1.py and src/module2.py are already committed
+    file1 = sources_repo / "src" / "module1.py"
+    file2 = sources_repo / "src" / "module2.py"
+    
+    # Modify file1 and stage it
+    file1.write_text(
+        "def func1():\n"
+        "    return 1\n"
+        "\n"
+        "def func1_new():\n"
+        "    return 11\n"
+    )
+    subprocess.run(["git", "add", str(file1)], cwd=sources_repo, check=True, **_QUIET)
+    
+    # Create linter
+    config = ProboscisConfig()
+    linter = ProboscisLinter(config)
+    
+    # Lint only changed files
+    violations = linter.lint_changed_files(sources_repo)
+    paths = {str(v.file_path) for v in violations}
+    
+    # Should only check file1, not file2
+    assert all(str(file1) in path for path in paths)
+    assert not any(str(file2) in path for path in paths)
 
 
 @pytest.mark.unit
-def test_lint_changed_files_untracked():
+def test_lint_changed_files_untracked(sources_repo):
     """Test linting untracked files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        # Initialize git repo
-        init_git_repo(tmpdir_path)
-        
-        # Create and commit initial file
-        src_dir = tmpdir_path / "src"
-        src_dir.mkdir()
-        
-        existing_file = src_dir / "existing.py"
-        existing_file.write_text(
-            "def existing():\n"
-            "    return 1\n"
-        )
-        
-        subprocess.run(["git", "add", "."], cwd=tmpdir_path, check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=tmpdir_path, check=True, capture_output=True)
-        
-        # Create new untracked file
-        new_file = src_dir / "new_file.py"
-        new_file.write_text(
-            "def untracked_function():\n"
-            "    return 42\n"
-        )
-        
-        # Create linter
-        config = ProboscisConfig()
-        linter = ProboscisLinter(config)
-        
-        # Lint only changed files
-        violations = linter.lint_changed_files(tmpdir_path)
-        
-        # Should find violations only in the new untracked file
-        assert any(v.function_name == "untracked_function" for v in violations)
-        assert not any("existing.py" in str(v.file_path) for v in violations)
+    # src/existing.py is already committed
+    
+    # Create new untracked file
+    new_file = sources_repo / "src" / "new_file.py"
+    new_file.write_text(
+        "def untracked_function():\n"
+        "    return 42\n"
+    )
+    
+    # Create linter
+    config = ProboscisConfig()
+    linter = ProboscisLinter(config)
+    
+    # Lint only changed files
+    violations = linter.lint_changed_files(sources_repo)
+    names = {v.function_name for v in violations}
+    paths = {str(v.file_path) for v in violations}
+    
+    # Should find violations only in the new untracked file
+    assert "untracked_function" in names
+    assert not any("existing.py" in path for path in paths)
 
 
 @pytest.mark.unit
-def test_lint_changed_files_no_changes():
+def test_lint_changed_files_no_changes(sources_repo):
     """Test linting when there are no changes."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        # Initialize git repo
-        init_git_repo(tmpdir_path)
-        
-        # Create and commit a file
-        src_dir = tmpdir_path / "src"
-        src_dir.mkdir()
-        
-        source_file = src_dir / "module.py"
-        source_file.write_text(
-            "def my_function():\n"
-            "    return 42\n"
-        )
-        
-        subprocess.run(["git", "add", "."], cwd=tmpdir_path, check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=tmpdir_path, check=True, capture_output=True)
-        
-        # Create linter
-        config = ProboscisConfig()
-        linter = ProboscisLinter(config)
-        
-        # Lint only changed files (there are none)
-        violations = linter.lint_changed_files(tmpdir_path)
-        
-        # Should have no violations since no files were checked
-        assert len(violations) == 0
\ No newline at end of file
+    # Every source file in sources_repo is committed and unmodified
+    
+    # Create linter
+    config = ProboscisConfig()
+    linter = ProboscisLinter(config)
+    
+    # Lint only changed files (there are none)
+    violations = linter.lint_changed_files(sources_repo)
+    
+    # Should have no violations since no files were checked
+    assert len(violations) == 0
\ No newline at end of file
@@ -5,27 +5,28 @@ from proboscis_linter.rust_linter import RustLinterWrapper
 from proboscis_linter.config import ProboscisConfig, RuleConfig
 
 
+# Static project whose source and test layout the rules are checked against
+_FIXTURE_DIR = Path(__file__).resolve().parent.parent.parent / "fixtures" / "test_project_hierarchical"
+
+
+@pytest.fixture(scope="class")
+def all_violations():
+    """Lint the hierarchical fixture project once with PL001-PL003 enabled."""
+    config = ProboscisConfig(
+        test_directories=["test"],
+        rules={rule: RuleConfig(enabled=True) for rule in ("PL001", "PL002", "PL003")}
+    )
+    return RustLinterWrapper(config).lint_project(_FIXTURE_DIR)
+
+
 class TestHierarchicalTests:
     """Test the hierarchical test structure support."""
     
     @pytest.mark.unit
-    def test_unit_test_discovery(self):
+    def test_unit_test_discovery(self, all_violations):
         """Test that PL001 finds unit tests in test/unit/ directory."""
-        config = ProboscisConfig(
-            test_directories=["test"],
-            rules={
-                "PL001": RuleConfig(enabled=True),
-                "PL002": RuleConfig(enabled=False),
-                "PL003": RuleConfig(enabled=False)
-            }
-        )
-        linter = RustLinterWrapper(config)
-        
-        test_project = Path(__file__).parent.parent.parent / "fixtures" / "test_project_hierarchical"
-        violations = linter.lint_project(test_project)
-        
         # Filter for PL001 violations
-        pl001_violations = [v for v in violations if v.rule_name.startswith("PL001")]
+        pl001_violations = [v for v in all_violations if v.rule_name.startswith("PL001")]
         
         # Should find violations for:
         # - divide (no unit test)
@@ -36,23 +37,10 @@ class TestHierarchicalTests:
         assert function_names == {"divide", "calculate_total"}
     
     @pytest.mark.unit
-    def test_integration_test_discovery(self):
+    def test_integration_test_discovery(self, all_violations):
         """Test that PL002 finds integration tests in test/integration/ directory."""
-        config = ProboscisConfig(
-            test_directories=["test"],
-            rules={
-                "PL001": RuleConfig(enabled=False),
-                "PL002": RuleConfig(enabled=True),
-                "PL003": RuleConfig(enabled=False)
-            }
-        )
-        linter = RustLinterWrapper(config)
-        
-        test_project = Path(__file__).parent.parent.parent / "fixtures" / "test_project_hierarchical"
-        violations = linter.lint_project(test_project)
-        
         # Filter for PL002 violations
-        pl002_violations = [v for v in violations if v.rule_name.startswith("PL002")]
+        pl002_violations = [v for v in all_violations if v.rule_name.startswith("PL002")]
         
         # Should find violations for:
         # - add (no integration test)
@@ -64,23 +52,10 @@ class TestHierarchicalTests:
         assert function_names == {"add", "multiply", "calculate_total"}
     
     @pytest.mark.unit
-    def test_e2e_test_discovery(self):
+    def test_e2e_test_discovery(self, all_violations):
         """Test that PL003 finds e2e tests in test/e2e/ directory."""
-        config = ProboscisConfig(
-            test_directories=["test"],
-            rules={
-                "PL001": RuleConfig(enabled=False),
-                "PL002": RuleConfig(enabled=False),
-                "PL003": RuleConfig(enabled=True)
-            }
-        )
-        linter = RustLinterWrapper(config)
-        
-        test_project = Path(__file__).parent.parent.parent / "fixtures" / "test_project_hierarchical"
-        violations = linter.lint_project(test_project)
-        
         # Filter for PL003 violations
-        pl003_violations = [v for v in violations if v.rule_name.startswith("PL003")]
+        pl003_violations = [v for v in all_violations if v.rule_name.startswith("PL003")]
         
         # Should find violations for:
         # - add (no e2e test)
@@ -92,24 +67,11 @@ class TestHierarchicalTests:
         assert function_names == {"add", "multiply", "divide"}
     
     @pytest.mark.unit
-    def test_all_rules_together(self):
+    def test_all_rules_together(self, all_violations):
         """Test all three rules running together."""
-        config = ProboscisConfig(
-            test_directories=["test"],
-            rules={
-                "PL001": RuleConfig(enabled=True),
-                "PL002": RuleConfig(enabled=True),
-                "PL003": RuleConfig(enabled=True)
-            }
-        )
-        linter = RustLinterWrapper(config)
-        
-        test_project = Path(__file__).parent.parent.parent / "fixtures" / "test_project_hierarchical"
-        violations = linter.lint_project(test_project)
-        
         # Count violations by rule
         rule_counts = {}
-        for v in violations:
+        for v in all_violations:
             rule_id = v.rule_name.split(":")[0]
             rule_counts[rule_id] = rule_counts.get(rule_id, 0) + 1
         
@@ -122,23 +84,10 @@ class TestHierarchicalTests:
         assert sum(rule_counts.values()) == 8
     
     @pytest.mark.unit
-    def test_error_messages_show_correct_directories(self):
+    def test_error_messages_show_correct_directories(self, all_violations):
         """Test that error messages indicate the correct test directory."""
-        config = ProboscisConfig(
-            test_directories=["test"],
-            rules={
-                "PL001": RuleConfig(enabled=True),
-                "PL002": RuleConfig(enabled=True),
-                "PL003": RuleConfig(enabled=True)
-            }
-        )
-        linter = RustLinterWrapper(config)
-        
-        test_project = Path(__file__).parent.parent.parent / "fixtures" / "test_project_hierarchical"
-        violations = linter.lint_project(test_project)
-        
         # Check that each rule mentions the correct directory
-        for v in violations:
+        for v in all_violations:
             if v.rule_name.startswith("PL001"):
                 assert "test/unit/" in v.message
             elif v.rule_name.startswith("PL002"):
@@ -1,23 +1,11 @@
 """Unit tests for PL004 rule with public/private function detection."""
-import tempfile
-from pathlib import Path
 import pytest
 from proboscis_linter.rust_linter import RustLinterWrapper
 from proboscis_linter.config import ProboscisConfig
 
 
-@pytest.mark.unit
-def test_pl004_ignores_private_test_functions():
-    """PL004 should not require markers on private test functions."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir)
-        
-        # Create test file with private test functions
-        test_dir = root / "test" / "unit"
-        test_dir.mkdir(parents=True)
-        test_file = test_dir / "test_example.py"
-        
-        test_file.write_text('''
+# Test sources, pre-encoded so tests write raw bytes
+_PRIVATE_FUNCTIONS_SRC = b'''
 @pytest.mark.unit
 def test_public_function():
     """Public test - requires marker."""
@@ -31,31 +19,9 @@ def _test_private_helper():
 def test_with_marker():
     """Has marker - no violation."""
     pass
-''')
-        
-        # Run linter
-        config = ProboscisConfig(rules={"PL004": {"enabled": True}})
-        linter = RustLinterWrapper(config)
-        violations = linter.lint_project(root)
-        
-        # Should only find violation for test_public_function
-        pl004_violations = [v for v in violations if v.rule_name.startswith("PL004")]
-        assert len(pl004_violations) == 1
-        assert pl004_violations[0].function_name == "test_public_function"
-
+'''
 
-@pytest.mark.unit
-def test_pl004_respects_test_module_all():
-    """PL004 should respect __all__ in test modules."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir)
-        
-        # Create test file with __all__
-        test_dir = root / "test" / "unit"
-        test_dir.mkdir(parents=True)
-        test_file = test_dir / "test_with_all.py"
-        
-        test_file.write_text('''
+_MODULE_ALL_SRC = b'''
 __all__ = ['test_exported']
 
 @pytest.mark.unit
@@ -72,31 +38,9 @@ def test_not_exported():
 def test_also_not_exported():
     """Not exported but has marker - OK."""
     pass
-''')
-        
-        # Run linter
-        config = ProboscisConfig(rules={"PL004": {"enabled": True}})
-        linter = RustLinterWrapper(config)
-        violations = linter.lint_project(root)
-        
-        # Should only find violation for test_exported
-        pl004_violations = [v for v in violations if v.rule_name.startswith("PL004")]
-        assert len(pl004_violations) == 1
-        assert pl004_violations[0].function_name == "test_exported"
-
+'''
 
-@pytest.mark.unit
-def test_pl004_with_test_classes():
-    """PL004 should handle test classes correctly."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir)
-        
-        # Create test file with test classes
-        test_dir = root / "test" / "integration"
-        test_dir.mkdir(parents=True)
-        test_file = test_dir / "test_classes.py"
-        
-        test_file.write_text('''
+_CLASSES_SRC = b'''
 class TestPublicClass:
     """Public test class."""
     @pytest.mark.unit
@@ -120,31 +64,9 @@ class _TestPrivateClass:
     def test_method(self):
         """Method in private class - no marker needed."""
         pass
-''')
-        
-        # Run linter
-        config = ProboscisConfig(rules={"PL004": {"enabled": True}})
-        linter = RustLinterWrapper(config)
-        violations = linter.lint_project(root)
-        
-        # Should only find violation for TestPublicClass.test_method
-        pl004_violations = [v for v in violations if v.rule_name.startswith("PL004")]
-        assert len(pl004_violations) == 1
-        assert pl004_violations[0].function_name == "test_method"
-
+'''
 
-@pytest.mark.unit
-def test_pl004_strict_mode():
-    """PL004 in strict mode should check all test functions."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir)
-        
-        # Create test file with private functions
-        test_dir = root / "test" / "e2e"
-        test_dir.mkdir(parents=True)
-        test_file = test_dir / "test_strict.py"
-        
-        test_file.write_text('''
+_STRICT_SRC = b'''
 @pytest.mark.unit
 def test_public():
     """Public test."""
@@ -153,35 +75,9 @@ def test_public():
 def _test_private():
     """Private test."""
     pass
-''')
-        
-        # Run linter in strict mode
-        config = ProboscisConfig(
-            rules={"PL004": {"enabled": True}},
-            strict_mode=True
-        )
-        linter = RustLinterWrapper(config)
-        violations = linter.lint_project(root)
-        
-        # Should find violations for both functions in strict mode
-        pl004_violations = [v for v in violations if v.rule_name.startswith("PL004")]
-        assert len(pl004_violations) == 2
-        func_names = {v.function_name for v in pl004_violations}
-        assert func_names == {"test_public", "_test_private"}
-
+'''
 
-@pytest.mark.unit
-def test_pl004_with_nested_test_functions():
-    """PL004 should handle nested test functions correctly."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir)
-        
-        # Create test file with nested functions
-        test_dir = root / "test" / "unit"
-        test_dir.mkdir(parents=True)
-        test_file = test_dir / "test_nested.py"
-        
-        test_file.write_text('''
+_NESTED_SRC = b'''
 @pytest.mark.unit
 def test_outer():
     """Outer test function - requires marker."""
@@ -196,31 +92,9 @@ def test_outer():
         pass
     
     test_inner()
-''')
-        
-        # Run linter
-        config = ProboscisConfig(rules={"PL004": {"enabled": True}})
-        linter = RustLinterWrapper(config)
-        violations = linter.lint_project(root)
-        
-        # Should only find violation for test_outer
-        pl004_violations = [v for v in violations if v.rule_name.startswith("PL004")]
-        assert len(pl004_violations) == 1
-        assert pl004_violations[0].function_name == "test_outer"
-
+'''
 
-@pytest.mark.unit
-def test_pl004_parametrized_tests():
-    """PL004 should handle parametrized tests correctly."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir)
-        
-        # Create test file with parametrized tests
-        test_dir = root / "test" / "unit"
-        test_dir.mkdir(parents=True)
-        test_file = test_dir / "test_parametrized.py"
-        
-        test_file.write_text('''
+_PARAMETRIZED_SRC = b'''
 import pytest
 
 @pytest.mark.unit
@@ -239,14 +113,46 @@ def test_marked_parametrized(x, y):
 def _test_private_parametrized(x, y):
     """Private parametrized test - no marker needed."""
     assert x < y
-''')
-        
-        # Run linter
-        config = ProboscisConfig(rules={"PL004": {"enabled": True}})
-        linter = RustLinterWrapper(config)
-        violations = linter.lint_project(root)
-        
-        # Should only find violation for test_public_parametrized
-        pl004_violations = [v for v in violations if v.rule_name.startswith("PL004")]
-        assert len(pl004_violations) == 1
-        assert pl004_violations[0].function_name == "test_public_parametrized"
\ No newline at end of file
+'''
+
+# (test file path, source, strict mode, function names expected to get a PL004 violation)
+_CASES = [
+    # Private test functions do not require markers
+    pytest.param("test/unit/test_example.py", _PRIVATE_FUNCTIONS_SRC, False,
+                 ["test_public_function"], id="ignores_private_test_functions"),
+    # __all__ in a test module decides what is public
+    pytest.param("test/unit/test_with_all.py", _MODULE_ALL_SRC, False,
+                 ["test_exported"], id="respects_test_module_all"),
+    # Only TestPublicClass.test_method; the private class is exempt
+    pytest.param("test/integration/test_classes.py", _CLASSES_SRC, False,
+                 ["test_method"], id="with_test_classes"),
+    # Strict mode checks private test functions too
+    pytest.param("test/e2e/test_strict.py", _STRICT_SRC, True,
+                 ["_test_private", "test_public"], id="strict_mode"),
+    # Nested functions are ignored
+    pytest.param("test/unit/test_nested.py", _NESTED_SRC, False,
+                 ["test_outer"], id="with_nested_test_functions"),
+    pytest.param("test/unit/test_parametrized.py", _PARAMETRIZED_SRC, False,
+                 ["test_public_parametrized"], id="parametrized_tests"),
+]
+
+
+@pytest.fixture(scope="module")
+def pl004_linters():
+    """PL004-only linters keyed by strict mode, each built once."""
+    return {
+        strict: RustLinterWrapper(ProboscisConfig(rules={"PL004": {"enabled": True}}, strict_mode=strict))
+        for strict in (False, True)
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("rel_path, source, strict, expected", _CASES)
+def test_pl004_public_functions(tmp_path, write_tree, pl004_linters, rel_path, source, strict, expected):
+    """PL004 should only require markers on the test functions it treats as public."""
+    write_tree(tmp_path, {rel_path: source})
+    
+    violations = pl004_linters[strict].lint_project(tmp_path)
+    
+    pl004_violations = [v for v in violations if v.rule_name.startswith("PL004")]
+    assert sorted(v.function_name for v in pl004_violations) == expected
@@ -1,14 +1,19 @@
 """Tests for configuration module."""
 from pathlib import Path
-import tempfile
 import pytest
+from loguru import logger
+from proboscis_linter import config as config_module
 from proboscis_linter.config import ProboscisConfig, ConfigLoader, RuleConfig
 
 
+# Default configuration the loader falls back to; do not mutate it
+_DEFAULT_CONFIG = ProboscisConfig()
+
+
 @pytest.mark.unit
 def test_default_config():
     """Test default configuration values."""
-    config = ProboscisConfig()
+    config = _DEFAULT_CONFIG
     
     assert config.test_directories == ["test", "tests"]
     assert config.test_patterns == ["test_*.py", "*_test.py"]
@@ -58,128 +63,13 @@ def test_rule_config():
     assert config.get_rule_options("PL003") == {}
 
 
-@pytest.mark.unit
-def test_load_from_pyproject_toml(tmp_path):
-    """Test loading configuration from pyproject.toml."""
-    config_content = """
-[tool.proboscis]
-test_directories = ["tests", "test"]
-test_patterns = ["test_*.py", "*_spec.py"]
-exclude_patterns = ["**/migrations/**"]
-output_format = "json"
-fail_on_error = true
-
-[tool.proboscis.rules]
-PL001 = true
-PL002 = false
-"""
-    
-    config_file = tmp_path / "pyproject.toml"
-    config_file.write_text(config_content)
-    
-    config = ConfigLoader.load_from_file(config_file)
-    
-    assert config.test_directories == ["tests", "test"]
-    assert config.test_patterns == ["test_*.py", "*_spec.py"]
-    assert config.exclude_patterns == ["**/migrations/**"]
-    assert config.output_format == "json"
-    assert config.fail_on_error is True
-    assert config.is_rule_enabled("PL001") is True
-    assert config.is_rule_enabled("PL002") is False
-
-
-@pytest.mark.unit
-def test_load_from_pyproject_toml_with_detailed_rules(tmp_path):
-    """Test loading configuration with detailed rule configuration."""
-    config_content = """
-[tool.proboscis]
-test_directories = ["tests"]
-
-[tool.proboscis.rules.PL001]
-enabled = true
-options = {max_violations = 10}
-
-[tool.proboscis.rules.PL002]
-enabled = false
-"""
-    
-    config_file = tmp_path / "pyproject.toml"
-    config_file.write_text(config_content)
-    
-    config = ConfigLoader.load_from_file(config_file)
-    
-    assert config.is_rule_enabled("PL001") is True
-    assert config.get_rule_options("PL001") == {"max_violations": 10}
-    assert config.is_rule_enabled("PL002") is False
-
-
 @pytest.mark.unit
 def test_load_missing_file():
     """Test loading from non-existent file."""
     config = ConfigLoader.load_from_file(Path("non_existent.toml"))
     
     # Should return default config
-    assert config.test_directories == ["test", "tests"]
-    assert config.output_format == "text"
-
-
-@pytest.mark.unit
-def test_find_config_file(tmp_path):
-    """Test finding config file in directory hierarchy."""
-    # Create nested directory structure
-    project_root = tmp_path / "project"
-    subdir = project_root / "src" / "module"
-    subdir.mkdir(parents=True)
-    
-    # Create config file at project root
-    config_content = """
-[tool.proboscis]
-test_directories = ["spec"]
-"""
-    config_file = project_root / "pyproject.toml"
-    config_file.write_text(config_content)
-    
-    # Should find config from subdirectory
-    found = ConfigLoader.find_config_file(subdir)
-    assert found == config_file
-    
-    # Should not find config without [tool.proboscis] section
-    config_file.write_text("[tool.other]\nvalue = 1")
-    found = ConfigLoader.find_config_file(subdir)
-    assert found is None
-
-
-@pytest.mark.unit
-def test_merge_cli_options():
-    """Test merging CLI options with configuration."""
-    config = ProboscisConfig(
-        output_format="text",
-        fail_on_error=False,
-        exclude_patterns=["*.pyc"]
-    )
-    
-    merged = ConfigLoader.merge_cli_options(
-        config,
-        format="json",
-        fail_on_error=True,
-        exclude=["*.tmp", "*.log"]
-    )
-    
-    assert merged.output_format == "json"
-    assert merged.fail_on_error is True
-    assert merged.exclude_patterns == ["*.pyc", "*.tmp", "*.log"]
-    
-    # Test with None values (no override)
-    merged2 = ConfigLoader.merge_cli_options(
-        config,
-        format=None,
-        fail_on_error=None,
-        exclude=None
-    )
-    
-    assert merged2.output_format == "text"
-    assert merged2.fail_on_error is False
-    assert merged2.exclude_patterns == ["*.pyc"]
+    assert config == _DEFAULT_CONFIG
 
 
 @pytest.mark.unit
@@ -255,82 +145,176 @@ def test_get_rule_options():
     assert config.get_rule_options("PL999") == {}
 
 
-@pytest.mark.unit
-def test_load_from_file():
-    """Test load_from_file with various scenarios."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-        
-        # Test 1: Valid config file
-        config_file = tmppath / "pyproject.toml"
-        config_file.write_text("""
+# (pyproject.toml source, config it should load to)
+_TOML_CASES = [
+    pytest.param("""
+[tool.proboscis]
+test_directories = ["tests", "test"]
+test_patterns = ["test_*.py", "*_spec.py"]
+exclude_patterns = ["**/migrations/**"]
+output_format = "json"
+fail_on_error = true
+
+[tool.proboscis.rules]
+PL001 = true
+PL002 = false
+""", ProboscisConfig(
+        test_directories=["tests", "test"],
+        test_patterns=["test_*.py", "*_spec.py"],
+        exclude_patterns=["**/migrations/**"],
+        output_format="json",
+        fail_on_error=True,
+        rules={"PL001": RuleConfig(enabled=True), "PL002": RuleConfig(enabled=False)},
+    ), id="pyproject_toml"),
+    pytest.param("""
+[tool.proboscis]
+test_directories = ["tests"]
+
+[tool.proboscis.rules.PL001]
+enabled = true
+options = {max_violations = 10}
+
+[tool.proboscis.rules.PL002]
+enabled = false
+""", ProboscisConfig(
+        test_directories=["tests"],
+        rules={
+            "PL001": RuleConfig(enabled=True, options={"max_violations": 10}),
+            "PL002": RuleConfig(enabled=False),
+        },
+    ), id="detailed_rules"),
+    pytest.param("""
 [tool.proboscis]
 test_directories = ["spec"]
 output_format = "json"
-""")
-        config = ConfigLoader.load_from_file(config_file)
-        assert config.test_directories == ["spec"]
-        assert config.output_format == "json"
-        
-        # Test 2: Invalid TOML
-        config_file.write_text("invalid toml content [[[")
-        config = ConfigLoader.load_from_file(config_file)
-        # Should return default config on error
-        assert config.test_directories == ["test", "tests"]
-        
-        # Test 3: TOML without [tool.proboscis] section
-        config_file.write_text("""
+""", ProboscisConfig(test_directories=["spec"], output_format="json"), id="valid_file"),
+    # Should return default config on error
+    pytest.param("invalid toml content [[[", _DEFAULT_CONFIG, id="invalid_toml"),
+    # Should return default config without a [tool.proboscis] section
+    pytest.param("""
 [build-system]
 requires = ["setuptools"]
-""")
-        config = ConfigLoader.load_from_file(config_file)
-        # Should return default config
-        assert config.test_directories == ["test", "tests"]
+""", _DEFAULT_CONFIG, id="missing_section"),
+]
 
 
 @pytest.mark.unit
-def test_find_config_file():
+@pytest.mark.parametrize("toml_src, expected", _TOML_CASES)
+def test_load_from_file(tmp_path, toml_src, expected):
+    """Test load_from_file with various scenarios."""
+    config_file = tmp_path / "pyproject.toml"
+    config_file.write_text(toml_src)
+
+    assert ConfigLoader.load_from_file(config_file) == expected
+
+
+@pytest.mark.unit
+def test_load_from_file_cached_until_modified(tmp_path, monkeypatch):
+    """Test repeated loads of an unchanged file parse it once but return independent copies."""
+    config_file = tmp_path / "pyproject.toml"
+    config_file.write_text('[tool.proboscis]\ntest_directories = ["spec"]\n')
+    
+    loads = []
+    real_load = config_module.tomllib.load
+    monkeypatch.setattr(config_module.tomllib, "load", lambda f: loads.append(f.name) or real_load(f))
+    
+    first = ConfigLoader.load_from_file(config_file)
+    first.test_directories.append("mutated")
+    assert ConfigLoader.load_from_file(config_file).test_directories == ["spec"]
+    assert loads == [str(config_file)]
+    
+    # A change in size invalidates the cached entry
+    config_file.write_text('[tool.proboscis]\ntest_directories = ["specs"]\n')
+    assert ConfigLoader.load_from_file(config_file).test_directories == ["specs"]
+
+
+@pytest.mark.unit
+def test_load_from_file_logs_failure_on_every_call(tmp_path):
+    """Test a broken config is reported on each load, not only the first."""
+    config_file = tmp_path / "pyproject.toml"
+    config_file.write_text("[tool.proboscis\n")
+    
+    errors = []
+    handler_id = logger.add(errors.append, level="ERROR")
+    try:
+        for _ in range(2):
+            assert ConfigLoader.load_from_file(config_file) == _DEFAULT_CONFIG
+    finally:
+        logger.remove(handler_id)
+    assert len(errors) == 2
+
+
+@pytest.mark.unit
+def test_find_config_file(tmp_path):
     """Test find_config_file traversing directory tree."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-        
-        # Create nested directory structure
-        root = tmppath / "project"
-        sub1 = root / "src"
-        sub2 = sub1 / "module"
-        sub3 = sub2 / "submodule"
-        sub3.mkdir(parents=True)
-        
-        # No config file exists
-        assert ConfigLoader.find_config_file(sub3) is None
-        
-        # Config at root level
-        config_file = root / "pyproject.toml"
-        config_file.write_text("""
+    tmppath = tmp_path
+    
+    # Create nested directory structure
+    root = tmppath / "project"
+    sub1 = root / "src"
+    sub2 = sub1 / "module"
+    sub3 = sub2 / "submodule"
+    sub3.mkdir(parents=True)
+    
+    # No config file exists
+    assert ConfigLoader.find_config_file(sub3) is None
+    
+    # Config at root level
+    config_file = root / "pyproject.toml"
+    config_file.write_text("""
 [tool.proboscis]
 test_directories = ["test"]
 """)
-        assert ConfigLoader.find_config_file(sub3) == config_file
-        assert ConfigLoader.find_config_file(sub2) == config_file
-        assert ConfigLoader.find_config_file(sub1) == config_file
-        assert ConfigLoader.find_config_file(root) == config_file
-        
-        # Config without [tool.proboscis] should be ignored
-        config_file.write_text("""
+    assert ConfigLoader.find_config_file(sub3) == config_file
+    assert ConfigLoader.find_config_file(sub2) == config_file
+    assert ConfigLoader.find_config_file(sub1) == config_file
+    assert ConfigLoader.find_config_file(root) == config_file
+    
+    # Config without [tool.proboscis] should be ignored
+    config_file.write_text("""
 [tool.other]
 value = 1
 """)
-        assert ConfigLoader.find_config_file(sub3) is None
-        
-        # Multiple config files - should find the closest one
-        sub1_config = sub1 / "pyproject.toml"
-        sub1_config.write_text("""
+    assert ConfigLoader.find_config_file(sub3) is None
+    
+    # Multiple config files - should find the closest one
+    sub1_config = sub1 / "pyproject.toml"
+    sub1_config.write_text("""
 [tool.proboscis]
 test_directories = ["spec"]
 """)
-        assert ConfigLoader.find_config_file(sub3) == sub1_config
-        assert ConfigLoader.find_config_file(sub2) == sub1_config
-        assert ConfigLoader.find_config_file(sub1) == sub1_config
+    assert ConfigLoader.find_config_file(sub3) == sub1_config
+    assert ConfigLoader.find_config_file(sub2) == sub1_config
+    assert ConfigLoader.find_config_file(sub1) == sub1_config
+
+
+@pytest.mark.unit
+def test_find_config_file_parses_each_file_once(tmp_path, monkeypatch):
+    """Test lookups from nested directories reuse the parsed [tool.proboscis] check."""
+    sub = tmp_path / "src" / "module"
+    sub.mkdir(parents=True)
+    config_file = tmp_path / "pyproject.toml"
+    config_file.write_text("""
+[tool.proboscis]
+test_directories = ["test"]
+""")
+    
+    loads = []
+    real_loads = config_module.tomllib.loads
+    monkeypatch.setattr(config_module.tomllib, "loads", lambda s: loads.append(s) or real_loads(s))
+    
+    for start in (sub, sub.parent, tmp_path):
+        assert ConfigLoader.find_config_file(start) == config_file
+    assert len(loads) == 1
+
+
+@pytest.mark.unit
+def test_find_config_file_skips_parse_without_proboscis(tmp_path, monkeypatch):
+    """Test pyproject.toml files that never mention proboscis are not TOML-parsed."""
+    (tmp_path / "pyproject.toml").write_text("[tool.other]\nvalue = 1")
+    
+    monkeypatch.setattr(config_module.tomllib, "loads", pytest.fail)
+    assert ConfigLoader.find_config_file(tmp_path) is None
 
 
 @pytest.mark.unit
@@ -373,4 +357,10 @@ def test_merge_cli_options():
     merged = ConfigLoader.merge_cli_options(base_config)
     assert merged.output_format == "text"
     assert merged.fail_on_error is False
+    assert merged.exclude_patterns == ["*.pyc"]
+    
+    # Explicit None values are treated the same as omitted options
+    merged = ConfigLoader.merge_cli_options(base_config, format=None, fail_on_error=None, exclude=None)
+    assert merged.output_format == "text"
+    assert merged.fail_on_error is False
     assert merged.exclude_patterns == ["*.pyc"]
\ No newline at end of file